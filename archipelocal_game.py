@@ -16,6 +16,11 @@ from Options import FreeText, NamedRange, OptionSet, Range, Toggle  # type: igno
 from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
+from .request_scheduler import request_scheduler
+
+
+# Geoapify free plan: 5 requests per second
+request_scheduler.configure_host("api.geoapify.com", rate=5.0, burst=5, max_concurrent=4)
 
 
 # -- Curated default category shortlist (Geoapify taxonomy) --
@@ -530,7 +535,7 @@ class ArchipelocalGame(Game):
                 if attempt > 0:
                     print(f"[Archipelocal] Geocoding retry {attempt}/{max_retries - 1} with {timeout}s timeout...")
                 
-                resp = requests.get(
+                resp = request_scheduler.get(
                     "https://api.geoapify.com/v1/geocode/search",
                     params=params,
                     timeout=timeout,
@@ -739,7 +744,7 @@ class ArchipelocalGame(Game):
                 if attempt > 0:
                     print(f"[Archipelocal] Retry {attempt}/{max_retries - 1} for '{query_cat}' with {timeout}s timeout...")
                 
-                resp = requests.get(
+                resp = request_scheduler.get(
                     "https://api.geoapify.com/v2/places",
                     params=params,
                     timeout=timeout,
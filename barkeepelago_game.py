@@ -3,13 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
-import requests
-
 from Options import FreeText, NamedRange, OptionList, Toggle
 
 from ..game import Game
 from ..game_objective_template import GameObjectiveTemplate
 from ..enums import KeymastersKeepGamePlatforms
+from .request_scheduler import request_scheduler
 
 
 VALID_FLAVORS: Tuple[str, ...] = (
@@ -82,6 +81,11 @@ VALID_DIETS: Tuple[str, ...] = (
     "vegetarian",
 )
 
+# API League bills per request; keep paging gentle
+request_scheduler.configure_host("api.apileague.com", rate=1.0, burst=2, max_concurrent=1)
+# TheCocktailDB's shared test key; random.php may be called dozens of times
+request_scheduler.configure_host("www.thecocktaildb.com", rate=2.0, burst=4, max_concurrent=2)
+
 
 @dataclass
 class BarkeepelagoArchipelagoOptions:
@@ -567,7 +571,7 @@ class BarkeepelagoDrinkHolder:
                 if low_yield_streak >= 2:
                     break
 
-                response = requests.get(
+                response = request_scheduler.get(
                     "https://api.apileague.com/search-drinks",
                     params=random_params,
                     timeout=30,
@@ -633,7 +637,7 @@ class BarkeepelagoDrinkHolder:
                 page_params["number"] = min(10, target_count - len(drinks_by_id))
                 page_params["offset"] = current_offset
 
-                response = requests.get(
+                response = request_scheduler.get(
                     "https://api.apileague.com/search-drinks",
                     params=page_params,
                     timeout=30,
@@ -699,7 +703,7 @@ class BarkeepelagoDrinkHolder:
         drinks: List[Dict[str, str]] = []
 
         if self.query.strip():
-            response = requests.get(
+            response = request_scheduler.get(
                 "https://www.thecocktaildb.com/api/json/v1/1/search.php",
                 params={"s": self.query.strip()},
                 timeout=30,
@@ -713,7 +717,7 @@ class BarkeepelagoDrinkHolder:
             for _ in range(target_count * 3):
                 if len(drinks) >= target_count:
                     break
-                response = requests.get(
+                response = request_scheduler.get(
                     "https://www.thecocktaildb.com/api/json/v1/1/random.php",
                     timeout=30,
                 )
@@ -17,10 +17,13 @@ Multiple CSV files are supported; all files in the folder are merged.
 
 from __future__ import annotations
 
+import bisect
 import csv
 import functools
+import operator
+from array import array
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple, Any
 
 from dataclasses import dataclass
 
@@ -28,6 +31,7 @@ from Options import FreeText, OptionSet, Toggle  # type: ignore
 from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
+from .collection_csv_cache import CSVFolderCache
 
 
 # === Options Dataclass ===
@@ -39,6 +43,7 @@ class BGGCollectionArchipelagoOptions:
     bgg_collection_include_solo_challenges: "BGGCollectionIncludeSoloChallenges"
     bgg_collection_include_weight_challenges: "BGGCollectionIncludeWeightChallenges"
     bgg_collection_excluded_games: "BGGCollectionExcludedGames"
+    bgg_collection_include_combined_challenges: "BGGCollectionIncludeCombinedChallenges"
 
 
 # === Module-level CSV holder with caching ===
@@ -50,6 +55,8 @@ class _BGGCollectionHolder:
 
     def __init__(self):
         self._notice_printed = False
+        # Parsed rows persisted next to the CSVs; stale files are parsed in a process pool
+        self._csv_cache = CSVFolderCache("BGG Collection", "BGG_COLLECTION")
 
     @functools.lru_cache(maxsize=4)
     def parse_collection(self, folder_path: str = "") -> List[Dict[str, Any]]:
@@ -77,8 +84,8 @@ class _BGGCollectionHolder:
         games: List[Dict[str, Any]] = []
         seen_ids: Set[int] = set()
 
-        for csv_file in csv_files:
-            for game in self._parse_csv_file(csv_file):
+        for file_games in self._csv_cache.parse_files(collection_dir, csv_files, _parse_bgg_csv_file):
+            for game in file_games:
                 game_id = game.get("id", 0)
                 if game_id and game_id not in seen_ids:
                     seen_ids.add(game_id)
@@ -89,103 +96,66 @@ class _BGGCollectionHolder:
         return games
 
     def _parse_csv_file(self, path: Path) -> List[Dict[str, Any]]:
-        """Parse a single BGG CSV export."""
+        """Parse a single BGG CSV export.
+
+        The header is compiled once into a column plan (an itemgetter over the
+        alias-resolved column indexes) and rows are read with csv.reader, so each
+        row costs one tuple pick and a single try block for its numeric columns.
+        """
         games: List[Dict[str, Any]] = []
 
         try:
             with open(path, "r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
                     return []
 
-                field_map = {h.strip().lower(): h for h in reader.fieldnames}
-
-                name_key = field_map.get("objectname", "") or field_map.get("name", "")
-                id_key = field_map.get("objectid", "") or field_map.get("object id", "")
-                year_key = field_map.get("yearpublished", "") or field_map.get("year published", "")
-                min_players_key = field_map.get("minplayers", "") or field_map.get("min players", "")
-                max_players_key = field_map.get("maxplayers", "") or field_map.get("max players", "")
-                playtime_key = field_map.get("playingtime", "") or field_map.get("playing time", "")
-                rating_key = field_map.get("rating", "")
-                avg_key = field_map.get("average", "") or field_map.get("bgg_rating", "")
-                weight_key = field_map.get("avgweight", "") or field_map.get("weight", "")
-                numplays_key = field_map.get("numplays", "") or field_map.get("plays", "")
-                own_key = field_map.get("own", "")
+                width = len(header)
+                pick, has_own = _compile_bgg_column_plan(header)
+                blank = [""] * width
 
                 for row in reader:
-                    name = (row.get(name_key, "") or "").strip()
-                    if not name:
-                        continue
-
-                    # Only include owned games if the 'own' column exists
-                    if own_key:
-                        own_val = (row.get(own_key, "") or "").strip()
-                        if own_val == "0":
+                    n = len(row)
+                    if n != width:
+                        if not n:
                             continue
+                        if n < width:
+                            row.extend(blank[n:])
+                        else:
+                            del row[width:]
+                    # Missing columns point at this trailing empty cell
+                    row.append("")
 
-                    game_id = 0
-                    id_raw = (row.get(id_key, "") or "").strip()
-                    try:
-                        game_id = int(id_raw) if id_raw else 0
-                    except ValueError:
-                        game_id = 0
-
-                    year = 0
-                    year_raw = (row.get(year_key, "") or "").strip()
-                    try:
-                        year = int(year_raw) if year_raw else 0
-                    except ValueError:
-                        year = 0
-
-                    min_players = 0
-                    min_raw = (row.get(min_players_key, "") or "").strip()
-                    try:
-                        min_players = int(min_raw) if min_raw else 0
-                    except ValueError:
-                        min_players = 0
-
-                    max_players = 0
-                    max_raw = (row.get(max_players_key, "") or "").strip()
-                    try:
-                        max_players = int(max_raw) if max_raw else 0
-                    except ValueError:
-                        max_players = 0
+                    (name, own_raw, id_raw, year_raw, min_raw, max_raw, pt_raw,
+                     rating_raw, avg_raw, weight_raw, plays_raw) = pick(row)
 
-                    playing_time = 0
-                    pt_raw = (row.get(playtime_key, "") or "").strip()
-                    try:
-                        playing_time = int(pt_raw) if pt_raw else 0
-                    except ValueError:
-                        playing_time = 0
-
-                    user_rating = 0.0
-                    rating_raw = (row.get(rating_key, "") or "").strip()
-                    if rating_raw and rating_raw.lower() not in ("n/a", ""):
-                        try:
-                            user_rating = float(rating_raw)
-                        except ValueError:
-                            user_rating = 0.0
-
-                    avg_rating = 0.0
-                    avg_raw = (row.get(avg_key, "") or "").strip()
-                    try:
-                        avg_rating = float(avg_raw) if avg_raw else 0.0
-                    except ValueError:
-                        avg_rating = 0.0
+                    name = name.strip()
+                    if not name:
+                        continue
 
-                    weight = 0.0
-                    weight_raw = (row.get(weight_key, "") or "").strip()
-                    try:
-                        weight = float(weight_raw) if weight_raw else 0.0
-                    except ValueError:
-                        weight = 0.0
+                    # Only include owned games if the 'own' column exists
+                    if has_own and own_raw.strip() == "0":
+                        continue
 
-                    num_plays = 0
-                    plays_raw = (row.get(numplays_key, "") or "").strip()
                     try:
-                        num_plays = int(plays_raw) if plays_raw else 0
+                        game_id = int(id_raw)
+                        year = int(year_raw)
+                        min_players = int(min_raw)
+                        max_players = int(max_raw)
+                        playing_time = int(pt_raw)
+                        num_plays = int(plays_raw)
+                        avg_rating = float(avg_raw)
+                        weight = float(weight_raw)
                     except ValueError:
-                        num_plays = 0
+                        game_id = _bgg_int(id_raw)
+                        year = _bgg_int(year_raw)
+                        min_players = _bgg_int(min_raw)
+                        max_players = _bgg_int(max_raw)
+                        playing_time = _bgg_int(pt_raw)
+                        num_plays = _bgg_int(plays_raw)
+                        avg_rating = _bgg_float(avg_raw)
+                        weight = _bgg_float(weight_raw)
 
                     games.append({
                         "id": game_id,
@@ -194,7 +164,7 @@ class _BGGCollectionHolder:
                         "min_players": min_players,
                         "max_players": max_players,
                         "playing_time": playing_time,
-                        "user_rating": user_rating,
+                        "user_rating": 0.0 if rating_raw in _BGG_UNRATED else _bgg_float(rating_raw),
                         "avg_rating": avg_rating,
                         "weight": weight,
                         "num_plays": num_plays,
@@ -207,10 +177,276 @@ class _BGGCollectionHolder:
 
         return games
 
+    @functools.lru_cache(maxsize=8)
+    def derived_views(self, folder_path: str, excluded: FrozenSet[str]) -> "_BGGCollectionViews":
+        """All accessor views for a folder and exclusion set, built in one pass."""
+        return _BGGCollectionViews(self.parse_collection(folder_path), excluded)
+
+
+def _playtime_category(pt: int) -> str:
+    if pt <= 30:
+        return "quick (30 min or less)"
+    if pt <= 60:
+        return "medium (30-60 min)"
+    if pt <= 120:
+        return "long (1-2 hours)"
+    return "epic (2+ hours)"
+
+
+def _weight_category(w: float) -> str:
+    if w < 2.0:
+        return "light (weight < 2.0)"
+    if w < 3.0:
+        return "medium (weight 2.0-3.0)"
+    if w < 4.0:
+        return "heavy (weight 3.0-4.0)"
+    return "very heavy (weight 4.0+)"
+
+
+class _BGGCollectionViews:
+    """Sorted name/category lists derived from one scan of the filtered collection."""
+
+    def __init__(self, collection: List[Dict[str, Any]], excluded: FrozenSet[str]):
+        self.filtered = [g for g in collection if g["name"] not in excluded] if excluded else collection
+
+        names: Set[str] = set()
+        counts: Set[str] = set()
+        playtimes: Set[str] = set()
+        weights: Set[str] = set()
+        solo: Set[str] = set()
+        decades: Set[str] = set()
+        unplayed: Set[str] = set()
+        highly_rated: Set[str] = set()
+        combos: Set[str] = set()
+
+        for g in self.filtered:
+            name = g.get("name", "")
+            min_p = g.get("min_players", 0)
+            max_p = g.get("max_players", 0)
+
+            supports = []
+            if min_p <= 2 and max_p >= 2:
+                supports.append("2 players")
+            if min_p <= 3 and max_p >= 3:
+                supports.append("3 players")
+            if min_p <= 4 and max_p >= 4:
+                supports.append("4 players")
+            if max_p >= 5:
+                supports.append("5+ players")
+            counts.update(supports)
+            if min_p == 1:
+                counts.add("solo (1 player)")
+
+            pt = g.get("playing_time", 0)
+            if pt > 0:
+                playtimes.add(_playtime_category(pt))
+            w = g.get("weight", 0.0)
+            if w > 0:
+                weights.add(_weight_category(w))
+            year = g.get("year", 0)
+            if year and year >= 1900:
+                decades.add(f"{(year // 10) * 10}s")
+
+            if not name:
+                continue
+            names.add(name)
+            if min_p == 1:
+                solo.add(name)
+            if g.get("num_plays", 0) == 0:
+                unplayed.add(name)
+            if g.get("avg_rating", 0) >= 7.5:
+                highly_rated.add(name)
+            combos.update(f"{name} with {support}" for support in supports)
+
+        self.games = sorted(names)
+        self.player_counts = sorted(counts)
+        self.playtime_categories = sorted(playtimes)
+        self.weight_categories = sorted(weights)
+        self.solo_games = sorted(solo)
+        self.decades = sorted(decades)
+        self.unplayed_games = sorted(unplayed)
+        self.highly_rated_games = sorted(highly_rated)
+        self.player_count_game_combos = sorted(combos)
+
+    @functools.cached_property
+    def index(self) -> "_BGGCollectionIndex":
+        return _BGGCollectionIndex(self.filtered)
+
+    @functools.cached_property
+    def combined_challenges(self) -> List[str]:
+        """Player count / playtime / weight combinations that at least one game satisfies."""
+        index = self.index
+        challenges = []
+        for players in _BGG_COMBINED_PLAYER_COUNTS:
+            who = "solo game" if players == 1 else f"{players}-player game"
+            for max_playtime in _BGG_COMBINED_PLAYTIME_CAPS:
+                for min_weight, max_weight in _BGG_COMBINED_WEIGHT_BANDS:
+                    if index.query_ids(
+                        players=players, max_playtime=max_playtime, min_weight=min_weight, max_weight=max_weight
+                    ):
+                        challenges.append(
+                            f"a {who} of {max_playtime} minutes or less with weight {min_weight:.1f}-{max_weight:.1f}"
+                        )
+        return challenges
+
+
+# Grid of constraints tried for combined challenges
+_BGG_COMBINED_PLAYER_COUNTS = (1, 2, 3, 4, 5)
+_BGG_COMBINED_PLAYTIME_CAPS = (30, 60, 120)
+_BGG_COMBINED_WEIGHT_BANDS = ((1.0, 2.0), (2.0, 3.0), (3.0, 4.0), (4.0, 5.0))
+
+
+class _BGGCollectionIndex:
+    """Sorted-array index over the numeric columns of a filtered collection.
+
+    Games are identified by their position in the filtered list. Each range field
+    keeps ids sorted by value (games with an unknown 0 value are left out), so a
+    range filter is two bisects and a slice; player counts use the min and max
+    player columns the same way. Queries intersect the per-field id sets.
+    """
+
+    RANGE_FIELDS = {
+        "playtime": "playing_time",
+        "weight": "weight",
+        "year": "year",
+        "rating": "avg_rating",
+        "user_rating": "user_rating",
+    }
+
+    def __init__(self, games: List[Dict[str, Any]]):
+        self.names = [g.get("name", "") for g in games]
+        self._sorted_ids: Dict[str, array] = {}
+        self._sorted_values: Dict[str, array] = {}
+        for field, key in self.RANGE_FIELDS.items():
+            self._add_column(field, [(float(g.get(key, 0) or 0), i) for i, g in enumerate(games) if g.get(key, 0)])
+        self._add_column("min_players", [(g.get("min_players", 0), i) for i, g in enumerate(games)])
+        self._add_column("max_players", [(g.get("max_players", 0), i) for i, g in enumerate(games)])
+        self._supporting: Dict[int, frozenset] = {}
+
+    def _add_column(self, field: str, pairs: List[Tuple[float, int]]) -> None:
+        pairs.sort()
+        self._sorted_values[field] = array("d", (value for value, _ in pairs))
+        self._sorted_ids[field] = array("L", (i for _, i in pairs))
+
+    def ids_in_range(self, field: str, low: float | None = None, high: float | None = None) -> frozenset:
+        """Ids whose field lies within [low, high] (either bound optional)."""
+        values = self._sorted_values[field]
+        start = bisect.bisect_left(values, low) if low is not None else 0
+        end = bisect.bisect_right(values, high) if high is not None else len(values)
+        return frozenset(self._sorted_ids[field][start:end])
+
+    def supporting(self, players: int) -> frozenset:
+        """Ids of games whose player range includes the given count."""
+        ids = self._supporting.get(players)
+        if ids is None:
+            ids = self.ids_in_range("min_players", high=players) & self.ids_in_range("max_players", low=players)
+            self._supporting[players] = ids
+        return ids
+
+    def query_ids(
+        self,
+        players: int | None = None,
+        min_playtime: float | None = None,
+        max_playtime: float | None = None,
+        min_weight: float | None = None,
+        max_weight: float | None = None,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        min_rating: float | None = None,
+        max_rating: float | None = None,
+        min_user_rating: float | None = None,
+        max_user_rating: float | None = None,
+    ) -> frozenset:
+        """Ids matching every given constraint; bounds are inclusive and None means unbounded.
+
+        rating bounds the BGG average; user_rating bounds your own rating. A bound
+        on a range field also drops games whose value for it is unknown (unrated).
+        """
+        selected: frozenset | None = None
+        if players is not None:
+            selected = self.supporting(players)
+        for field, low, high in (
+            ("playtime", min_playtime, max_playtime),
+            ("weight", min_weight, max_weight),
+            ("year", min_year, max_year),
+            ("rating", min_rating, max_rating),
+            ("user_rating", min_user_rating, max_user_rating),
+        ):
+            if low is None and high is None:
+                continue
+            ids = self.ids_in_range(field, low, high)
+            selected = ids if selected is None else selected & ids
+            if not selected:
+                return frozenset()
+        return frozenset(range(len(self.names))) if selected is None else selected
+
+    def query(self, **constraints: Any) -> List[str]:
+        """Sorted game names matching query_ids(**constraints)."""
+        return sorted({self.names[i] for i in self.query_ids(**constraints) if self.names[i]})
+
+
+# Header aliases per normalized field, in the order the column plan yields them
+_BGG_COLUMN_ALIASES = (
+    ("objectname", "name"),
+    ("own",),
+    ("objectid", "object id"),
+    ("yearpublished", "year published"),
+    ("minplayers", "min players"),
+    ("maxplayers", "max players"),
+    ("playingtime", "playing time"),
+    ("rating",),
+    ("average", "bgg_rating"),
+    ("avgweight", "weight"),
+    ("numplays", "plays"),
+)
+
+
+# Most rows are unrated; skipping float() for these avoids an exception per row
+_BGG_UNRATED = frozenset({"", "N/A", "n/a"})
+
+
+def _compile_bgg_column_plan(header: List[str]) -> Tuple[Callable[[List[str]], Tuple[str, ...]], bool]:
+    """Resolve header aliases to column indexes once per file.
+
+    Returns (pick, has_own): pick maps a row padded with one trailing empty cell
+    to the raw values in _BGG_COLUMN_ALIASES order, reading that trailing cell
+    for columns the export lacks. When a header repeats, the last column wins.
+    """
+    positions = {h.strip().lower(): i for i, h in enumerate(header)}
+    missing = len(header)
+    indexes = []
+    for aliases in _BGG_COLUMN_ALIASES:
+        index = missing
+        for alias in aliases:
+            if alias in positions:
+                index = positions[alias]
+                break
+        indexes.append(index)
+    return operator.itemgetter(*indexes), indexes[1] != missing
+
+
+def _bgg_int(raw: str) -> int:
+    try:
+        return int(raw)
+    except ValueError:
+        return 0
+
+
+def _bgg_float(raw: str) -> float:
+    try:
+        return float(raw)
+    except ValueError:
+        return 0.0
+
 
 _bgg_holder = _BGGCollectionHolder()
 
 
+def _parse_bgg_csv_file(path: str) -> List[Dict[str, Any]]:
+    """Process-pool worker: parse one CSV with this process's holder."""
+    return _bgg_holder._parse_csv_file(Path(path))
+
+
 # === Main Game Class ===
 class BGGCollectionGame(Game):
     name = "BGG Collection"
@@ -286,119 +522,67 @@ class BGGCollectionGame(Game):
         except Exception:
             return True
 
-    def _filtered_games(self) -> List[Dict[str, Any]]:
-        """Apply game exclusion filter."""
-        collection = _bgg_holder.parse_collection(self._get_collection_dir())
-        excluded = self._excluded_games()
+    def _include_combined_challenges(self) -> bool:
+        opts = getattr(self, "archipelago_options", None)
+        if opts is None:
+            return False
+        try:
+            return bool(getattr(opts.bgg_collection_include_combined_challenges, "value", False))
+        except Exception:
+            return False
 
-        if not excluded:
-            return collection
+    def _views(self) -> _BGGCollectionViews:
+        return _bgg_holder.derived_views(self._get_collection_dir(), frozenset(self._excluded_games()))
 
-        return [g for g in collection if g["name"] not in excluded]
+    def _filtered_games(self) -> List[Dict[str, Any]]:
+        """Apply game exclusion filter."""
+        return self._views().filtered
 
     # === Attribute extraction ===
+    # Each accessor returns a fresh copy of a memoized view so callers may mutate it.
     def games(self) -> List[str]:
         """Returns game names."""
-        return sorted({g["name"] for g in self._filtered_games() if g["name"]})
+        return list(self._views().games)
 
     def player_counts(self) -> List[str]:
         """Returns unique player count descriptions."""
-        collection = self._filtered_games()
-        counts: Set[str] = set()
-        for g in collection:
-            min_p = g.get("min_players", 0)
-            max_p = g.get("max_players", 0)
-            if min_p == 1:
-                counts.add("solo (1 player)")
-            if min_p <= 2 and max_p >= 2:
-                counts.add("2 players")
-            if min_p <= 3 and max_p >= 3:
-                counts.add("3 players")
-            if min_p <= 4 and max_p >= 4:
-                counts.add("4 players")
-            if max_p >= 5:
-                counts.add("5+ players")
-        return sorted(counts)
+        return list(self._views().player_counts)
 
     def playtime_categories(self) -> List[str]:
         """Returns playtime category descriptions."""
-        collection = self._filtered_games()
-        categories: Set[str] = set()
-        for g in collection:
-            pt = g.get("playing_time", 0)
-            if pt > 0:
-                if pt <= 30:
-                    categories.add("quick (30 min or less)")
-                elif pt <= 60:
-                    categories.add("medium (30-60 min)")
-                elif pt <= 120:
-                    categories.add("long (1-2 hours)")
-                else:
-                    categories.add("epic (2+ hours)")
-        return sorted(categories)
+        return list(self._views().playtime_categories)
 
     def weight_categories(self) -> List[str]:
         """Returns complexity/weight categories based on BGG weight rating."""
-        collection = self._filtered_games()
-        categories: Set[str] = set()
-        for g in collection:
-            w = g.get("weight", 0.0)
-            if w > 0:
-                if w < 2.0:
-                    categories.add("light (weight < 2.0)")
-                elif w < 3.0:
-                    categories.add("medium (weight 2.0-3.0)")
-                elif w < 4.0:
-                    categories.add("heavy (weight 3.0-4.0)")
-                else:
-                    categories.add("very heavy (weight 4.0+)")
-        return sorted(categories)
+        return list(self._views().weight_categories)
 
     def solo_games(self) -> List[str]:
         """Returns games that support solo play."""
-        collection = self._filtered_games()
-        return sorted({g["name"] for g in collection if g.get("min_players", 0) == 1 and g["name"]})
+        return list(self._views().solo_games)
 
     def decades(self) -> List[str]:
         """Returns decade strings."""
-        collection = self._filtered_games()
-        decade_set: Set[str] = set()
-        for g in collection:
-            year = g.get("year", 0)
-            if year and year >= 1900:
-                decade = (year // 10) * 10
-                decade_set.add(f"{decade}s")
-        return sorted(decade_set)
+        return list(self._views().decades)
 
     def unplayed_games(self) -> List[str]:
         """Returns games with 0 recorded plays (shame pile!)."""
-        collection = self._filtered_games()
-        return sorted({g["name"] for g in collection if g.get("num_plays", 0) == 0 and g["name"]})
+        return list(self._views().unplayed_games)
 
     def highly_rated_games(self) -> List[str]:
         """Returns games with a BGG average rating of 7.5+."""
-        collection = self._filtered_games()
-        return sorted({g["name"] for g in collection if g.get("avg_rating", 0) >= 7.5 and g["name"]})
+        return list(self._views().highly_rated_games)
 
     def player_count_game_combos(self) -> List[str]:
         """Returns validated 'GAME at N players' combo strings."""
-        collection = self._filtered_games()
-        combos: Set[str] = set()
-        for g in collection:
-            name = g.get("name", "")
-            if not name:
-                continue
-            min_p = g.get("min_players", 0)
-            max_p = g.get("max_players", 0)
-            if min_p <= 2 and max_p >= 2:
-                combos.add(f"{name} with 2 players")
-            if min_p <= 3 and max_p >= 3:
-                combos.add(f"{name} with 3 players")
-            if min_p <= 4 and max_p >= 4:
-                combos.add(f"{name} with 4 players")
-            if max_p >= 5:
-                combos.add(f"{name} with 5+ players")
-        return sorted(combos)
+        return list(self._views().player_count_game_combos)
+
+    def combined_challenges(self) -> List[str]:
+        """Returns player count / playtime / weight combinations some game satisfies."""
+        return list(self._views().combined_challenges)
+
+    def query_games(self, **constraints: Any) -> List[str]:
+        """Games matching index constraints, e.g. query_games(players=3, max_playtime=60, min_user_rating=8)."""
+        return self._views().index.query(**constraints)
 
     # === Objective generation ===
     def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
@@ -528,6 +712,18 @@ class BGGCollectionGame(Game):
                 )
             )
 
+        # Combined player count / playtime / weight constraints (pre-validated via the index)
+        if self._include_combined_challenges() and self.combined_challenges():
+            objectives.append(
+                GameObjectiveTemplate(
+                    label="Play COMBINED_CHALLENGE from your collection",
+                    data={"COMBINED_CHALLENGE": (self.combined_challenges, 1)},
+                    is_time_consuming=False,
+                    is_difficult=False,
+                    weight=2,
+                )
+            )
+
         return objectives
 
 
@@ -566,6 +762,16 @@ class BGGCollectionIncludeWeightChallenges(Toggle):
     display_name = "BGG Collection Include Weight Challenges"
 
 
+class BGGCollectionIncludeCombinedChallenges(Toggle):
+    """
+    Include challenges that combine a player count, a maximum play time and a weight range
+    (e.g., 'Play a 3-player game of 60 minutes or less with weight 2.0-3.0 from your collection').
+    Only combinations matched by at least one game in your collection are offered.
+    """
+
+    display_name = "BGG Collection Include Combined Challenges"
+
+
 class BGGCollectionExcludedGames(OptionSet):
     """
     Games to exclude from challenge generation.
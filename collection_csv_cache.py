@@ -0,0 +1,146 @@
+"""
+Shared parsed-row cache for the CSV collection games.
+
+BGG Collection, Film Collection and Reading Collection keep the rows parsed from
+each export folder in a JSON ``.kmkcache`` file next to the CSVs, keyed by every
+file's size and mtime, so unchanged exports are not re-read on the next run.
+Files that do need parsing are spread over a process pool when there are
+enough of them to pay for starting one.
+
+This module defines no game; copy it next to any of the game files above.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from os import environ
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+_CACHE_FILE = ".kmkcache"
+# Version 1 caches were pickles; they fail to decode and are rebuilt
+_CACHE_VERSION = 2
+# Stale CSV data (MB) above which several files are parsed in a process pool
+_PARALLEL_THRESHOLD_MB = 8
+
+
+class CSVFolderCache:
+    """Parsed CSV rows per export folder for one collection game.
+
+    label prefixes log lines (e.g. "BGG Collection"); env_prefix names the
+    <env_prefix>_CACHE switch that disables the cache when set to 0/false/no/off
+    and the <env_prefix>_WORKERS override for the parsing process count.
+    The cache is plain JSON, so a tampered file can at worst yield wrong rows.
+    """
+
+    def __init__(self, label: str, env_prefix: str):
+        self.label = label
+        self.env_prefix = env_prefix
+
+    def enabled(self) -> bool:
+        flag = (environ.get(f"{self.env_prefix}_CACHE") or "").strip().lower()
+        return flag not in ("0", "false", "no", "off")
+
+    def load(self, folder: Path) -> Dict[str, Dict[str, Any]]:
+        """Cached rows per CSV file name, or {} when missing, disabled or unreadable."""
+        if not self.enabled():
+            return {}
+        cache_path = folder / _CACHE_FILE
+        if not cache_path.exists():
+            return {}
+        try:
+            with cache_path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[{self.label}] Ignoring unreadable cache '{cache_path}': {type(e).__name__}: {e}")
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+            return {}
+        files = payload.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def save(self, folder: Path, files: Dict[str, Dict[str, Any]]) -> None:
+        """Persist parsed rows next to the CSVs; failures are non-fatal."""
+        cache_path = folder / _CACHE_FILE
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"version": _CACHE_VERSION, "files": files}, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"[{self.label}] Could not write cache '{cache_path}': {type(e).__name__}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def parse_files(
+        self,
+        folder: Path,
+        csv_files: List[Path],
+        parse_file: Callable[[str], List[Dict[str, Any]]],
+    ) -> List[List[Dict[str, Any]]]:
+        """Rows of each CSV in order, reparsing only files whose size or mtime changed.
+
+        Unchanged files are served from the folder's cache; the rest go to
+        parse_file, which takes a path string and must be a picklable module-level
+        function (or a functools.partial of one) so it can run in a worker process.
+        The cache is rewritten when any file was reparsed, added or removed.
+        """
+        cached = self.load(folder)
+        stats = [csv_file.stat() for csv_file in csv_files]
+        results: List[List[Dict[str, Any]] | None] = []
+        stale: List[int] = []
+        for i, (csv_file, stat) in enumerate(zip(csv_files, stats)):
+            entry = cached.get(csv_file.name)
+            if (
+                isinstance(entry, dict)
+                and entry.get("size") == stat.st_size
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and isinstance(entry.get("rows"), list)
+            ):
+                results.append(entry["rows"])
+            else:
+                results.append(None)
+                stale.append(i)
+
+        stale_paths = [str(csv_files[i]) for i in stale]
+        workers = self.ingest_workers(len(stale), sum(stats[i].st_size for i in stale) / (1024 * 1024))
+        parsed: List[List[Dict[str, Any]]] | None = None
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    parsed = list(pool.map(parse_file, stale_paths))
+                print(f"[{self.label}] Parsed {len(stale)} CSV files across {workers} processes")
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                print(f"[{self.label}] Parallel CSV parsing unavailable ({type(e).__name__}: {e}); parsing serially...")
+        if parsed is None:
+            parsed = [parse_file(path) for path in stale_paths]
+        for i, rows in zip(stale, parsed):
+            results[i] = rows
+
+        files: Dict[str, Dict[str, Any]] = {}
+        for csv_file, stat, rows in zip(csv_files, stats, results):
+            if rows:
+                files[csv_file.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "rows": rows}
+        if self.enabled() and (any(parsed) or files.keys() != cached.keys()):
+            self.save(folder, files)
+        return results
+
+    def ingest_workers(self, file_count: int, total_mb: float) -> int:
+        """Process count for parsing stale CSVs; 1 means parse serially.
+
+        <env_prefix>_WORKERS overrides the CPU count. Parallel parsing needs at least
+        two files and _PARALLEL_THRESHOLD_MB of CSV data to outweigh pool startup.
+        """
+        if file_count < 2 or total_mb < _PARALLEL_THRESHOLD_MB:
+            return 1
+        try:
+            workers = int(environ.get(f"{self.env_prefix}_WORKERS") or (os.cpu_count() or 1))
+        except ValueError:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, file_count))
@@ -23,6 +23,7 @@ from Options import FreeText, OptionSet, Toggle  # type: ignore
 from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
+from .request_scheduler import request_scheduler
 
 
 # === Options Dataclass ===
@@ -35,6 +36,10 @@ class DiscogsCollectionArchipelagoOptions:
     discogs_collection_include_deep_dives: "DiscogsCollectionIncludeDeepDives"
 
 
+# Discogs allows 60 requests per minute with a token (25 without), counted over a moving minute
+request_scheduler.configure_host("api.discogs.com", rate=1.0, burst=5, max_concurrent=2, retry_backoff=2.0)
+
+
 # === Module-level data holder with caching ===
 class _DiscogsCollectionHolder:
     """Caches raw Discogs collection data keyed by (username, token)."""
@@ -65,7 +70,7 @@ class _DiscogsCollectionHolder:
         try:
             while True:
                 params["page"] = page
-                resp = requests.get(base_url, headers=headers, params=params, timeout=30)
+                resp = request_scheduler.get(base_url, headers=headers, params=params, timeout=30)
 
                 if resp.status_code == 404:
                     if not self._notice_printed:
@@ -26,6 +26,7 @@ from Options import FreeText, OptionSet, TextChoice, Toggle  # type: ignore
 from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
+from .collection_csv_cache import CSVFolderCache
 
 
 # === Options Dataclass ===
@@ -49,6 +50,8 @@ class _FilmCollectionHolder:
 
     def __init__(self):
         self._notice_printed = False
+        # Parsed rows persisted next to the CSVs; stale files are parsed in a process pool
+        self._csv_cache = CSVFolderCache("Film Collection", "FILM_COLLECTION")
 
     @functools.lru_cache(maxsize=4)
     def parse_source(self, source: str, base_dir: str = "") -> List[Dict[str, Any]]:
@@ -81,8 +84,8 @@ class _FilmCollectionHolder:
                     self._notice_printed = True
                 continue
 
-            for csv_file in csv_files:
-                films.extend(self._parse_csv_file(csv_file, src))
+            for file_films in self._csv_cache.parse_files(src_dir, csv_files, functools.partial(_parse_film_csv_file, csv_format=src)):
+                films.extend(file_films)
 
         return films
 
@@ -264,6 +267,11 @@ class _FilmCollectionHolder:
 _film_holder = _FilmCollectionHolder()
 
 
+def _parse_film_csv_file(path: str, csv_format: str) -> List[Dict[str, Any]]:
+    """Process-pool worker: parse one CSV with this process's holder."""
+    return _film_holder._parse_csv_file(Path(path), csv_format)
+
+
 # === Main Game Class ===
 class FilmCollectionGame(Game):
     name = "Film Collection"
@@ -5,12 +5,24 @@ Playnite Library integration for Keymasters Keep: provides attribute extraction,
 
 from __future__ import annotations
 
+import bisect
+import codecs
 import functools
+import hashlib
+import heapq
 import json
+import mmap
+import os
+import pickle
 import requests  # type: ignore
 from os import environ
 from pathlib import Path
-from typing import List, Dict, Set, Any
+from threading import Lock
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Set, Any, BinaryIO, Iterable, Iterator, TextIO, Tuple
 
 from dataclasses import dataclass
 
@@ -20,6 +32,40 @@ from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
 
+# Keys under which exporters wrap the games list when the top level is a dict
+_PLAYNITE_GAMES_KEYS = ("Games", "games", "Items", "items", "Library", "library")
+# Local exports above this size are parsed incrementally instead of with json.load
+_PLAYNITE_STREAMING_THRESHOLD_MB = 50
+# Bytes inspected to choose encoding and JSON-vs-NDJSON before the single full read
+_PLAYNITE_SNIFF_BYTES = 8 * 1024
+# NDJSON exports above this size are decoded in a process pool
+_PLAYNITE_PARALLEL_THRESHOLD_MB = 20
+# Characters read per chunk by the streaming parser
+_PLAYNITE_STREAM_CHUNK_CHARS = 1 << 20
+# NTH ordering label -> (sort field, descending), shared by objectives and the index
+_PLAYNITE_ORDERINGS: Dict[str, Tuple[str, bool]] = {
+    "most recently added": ("Added", True),
+    "least recently added": ("Added", False),
+    "newest": ("release_year", True),
+    "oldest": ("release_year", False),
+    "highest-rated (UserScore)": ("user_score", True),
+    "highest-rated (CriticScore)": ("critic_score", True),
+    "highest-rated (CommunityScore)": ("community_score", True),
+    "alphabetical by name": ("name", False),
+}
+# Draws of (attribute value, ordering, NTH) tried before giving up on an ordered attribute game
+_PLAYNITE_ORDERED_CHOICE_ATTEMPTS = 20
+# Shared filtered views keyed by (library path, normalized filter tuple), LRU-bounded
+_PLAYNITE_VIEW_CACHE: "OrderedDict[Tuple[str, Tuple[Any, ...]], _PlayniteFilteredView]" = OrderedDict()
+_PLAYNITE_VIEW_CACHE_SIZE = 32
+_PLAYNITE_VIEW_CACHE_LOCK = Lock()
+# Normalized-record cache written next to the export; bump the version when the
+# normalized record layout changes so stale caches are ignored
+_PLAYNITE_CACHE_SUFFIX = ".kmkcache"
+_PLAYNITE_CACHE_VERSION = 2
+# Bytes hashed from each end of the export for the cache fingerprint
+_PLAYNITE_FINGERPRINT_BYTES = 64 * 1024
+
 # Option Dataclass
 @dataclass
 class PlayniteLibraryArchipelagoOptions:
@@ -94,120 +140,34 @@ class PlayniteLibraryGame(Game):
 
         excluded_games_set = self.excluded_games()
 
-        # Initialize caches
-        self._filtered_games_display: List[str] = []
-        self._filtered_games_items: List[Dict[str, Any]] = []
-        self._cats: Set[str] = set()
-        self._series: Set[str] = set()
-        self._tags: Set[str] = set()
-        self._genres: Set[str] = set()
-        self._platforms: Set[str] = set()
-        self._features: Set[str] = set()
-        self._sources: Set[str] = set()
-        self._years: Set[int] = set()
-        self._tag_to_games: Dict[str, List[str]] = {}
-
-        for game in self._get_library_games():
-            # Playtime filter
-            if game.get("playtime_minutes", 0) < min_time_played:
-                continue
-            if max_time_played != -1 and game.get("playtime_minutes", 0) > max_time_played:
-                continue
-
-            # Exclusion filter by name/id
-            if game["name"] in excluded_games_set or str(game.get("id", "")) in excluded_games_set:
-                continue
-
-            # Completion status filter
-            completion_status = game.get("completion_status")
-            if completion_status and excluded_statuses and completion_status in excluded_statuses:
-                continue
-
-            # Release year filter
-            try:
-                release_year = int(game.get("release_year", 0) or 0)
-            except (ValueError, TypeError):
-                release_year = 0
-            if release_year:
-                if release_year < min_release_year or release_year > max_release_year:
-                    continue
-
-            # Score filters
-            if game.get("user_score", 0) < min_user_score:
-                continue
-            if game.get("critic_score", 0) < min_critic_score:
-                continue
-            if game.get("community_score", 0) < min_community_score:
-                continue
-
-            # Passed all filters -> include
-            display_name = game["name"]
-            src = game.get("source")
-            if src:
-                display_name = f"{display_name} [Source: {src}]"
-
-            self._filtered_games_display.append(display_name)
-            self._filtered_games_items.append(game)
-
-            # Attribute sets from filtered items
-            # Categories
-            for cat in game.get("Categories") or []:
-                if isinstance(cat, dict) and "Name" in cat:
-                    self._cats.add(cat["Name"])
-                elif isinstance(cat, str):
-                    self._cats.add(cat)
-            # Series
-            ser = game.get("Series")
-            if isinstance(ser, list):
-                for s in ser:
-                    if isinstance(s, dict) and "Name" in s:
-                        self._series.add(s["Name"])
-                    elif isinstance(s, str) and s:
-                        self._series.add(s)
-            elif isinstance(ser, dict) and "Name" in ser:
-                self._series.add(ser["Name"])
-            elif isinstance(ser, str) and ser:
-                self._series.add(ser)
-            # Tags
-            names_for_this_game: Set[str] = set()
-            for t in game.get("Tags") or []:
-                if isinstance(t, dict) and "Name" in t:
-                    names_for_this_game.add(t["Name"])
-                elif isinstance(t, str):
-                    names_for_this_game.add(t)
-            self._tags.update(names_for_this_game)
-            # Genres
-            for gname in game.get("Genres") or []:
-                if isinstance(gname, dict) and "Name" in gname:
-                    self._genres.add(gname["Name"])
-                elif isinstance(gname, str):
-                    self._genres.add(gname)
-            # Platforms
-            for plat in game.get("Platforms") or []:
-                if isinstance(plat, dict) and "Name" in plat:
-                    self._platforms.add(plat["Name"])
-                elif isinstance(plat, str):
-                    self._platforms.add(plat)
-            # Features
-            for feat in game.get("Features") or []:
-                if isinstance(feat, dict) and "Name" in feat:
-                    self._features.add(feat["Name"])
-                elif isinstance(feat, str):
-                    self._features.add(feat)
-            # Source
-            if src:
-                self._sources.add(src)
-            # Years
-            if release_year:
-                self._years.add(release_year)
+        json_path = self._get_json_path()
+        filters = (
+            min_time_played,
+            max_time_played,
+            frozenset(str(g) for g in excluded_games_set),
+            frozenset(str(st) for st in (excluded_statuses or ())),
+            min_release_year,
+            max_release_year,
+            min_user_score,
+            min_critic_score,
+            min_community_score,
+        )
+        view = _playnite_filtered_view(json_path, filters)
+
+        # Instances with identical options share one cached view
+        self._index = view.index
+        self._selected_ids = view.selected
+        self._filtered_games_display: List[str] = view.display
+        self._cats: Set[str] = view.attribute_sets["Categories"]
+        self._series: Set[str] = view.attribute_sets["Series"]
+        self._tags: Set[str] = view.attribute_sets["Tags"]
+        self._genres: Set[str] = view.attribute_sets["Genres"]
+        self._platforms: Set[str] = view.attribute_sets["Platforms"]
+        self._features: Set[str] = view.attribute_sets["Features"]
+        self._sources: Set[str] = view.attribute_sets["source"]
+        self._years: Set[int] = view.years
 
         self._computed_ready = True
-    def _get_library_games(self) -> List[Dict[str, Any]]:
-        """Get the library games, using lru_cache on PlayniteLibraryHolder.games()."""
-        json_path = self._get_json_path()
-        if not json_path:
-            return []
-        return playnite_library.games(json_path)
 
     # === Attribute extraction helpers ===
     @property
@@ -443,16 +403,7 @@ class PlayniteLibraryGame(Game):
             ("CATEGORY", lambda: list(self.categories)),
             ("SOURCE", lambda: list(self.sources)),
         ]
-        ordering_options = [
-            "most recently added",
-            "least recently added",
-            "newest",
-            "oldest",
-            "highest-rated (UserScore)",
-            "highest-rated (CriticScore)",
-            "highest-rated (CommunityScore)",
-            "alphabetical by name",
-        ]
+        ordering_options = list(_PLAYNITE_ORDERINGS)
 
         # 5) Attribute-based filters – TAG/GENRE/FEATURE/PLATFORM/CATEGORY/SOURCE
         #    - Only include if attribute list is non-empty
@@ -520,6 +471,28 @@ class PlayniteLibraryGame(Game):
                     )
                 )
 
+        # 7) Resolved ordering objectives – the NTH game of an ordering, looked up through
+        #    the precomputed rank indexes so the player gets a concrete game
+        objectives.append(
+            GameObjectiveTemplate(
+                label="Play ORDERED_GAME",
+                data={"ORDERED_GAME": (lambda: list(self.ordered_game_choices()), 1)},
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=2,
+            )
+        )
+        if any(attr_func() for _, attr_func in attribute_types):
+            objectives.append(
+                GameObjectiveTemplate(
+                    label="Play ORDERED_ATTRIBUTE_GAME",
+                    data={"ORDERED_ATTRIBUTE_GAME": (lambda: list(self.ordered_attribute_game_choices()), 1)},
+                    is_time_consuming=False,
+                    is_difficult=False,
+                    weight=2,
+                )
+            )
+
         seen_labels = set()
         unique_objectives = []
         for obj in objectives:
@@ -552,6 +525,54 @@ class PlayniteLibraryGame(Game):
     # Note: We intentionally do not compute per-subset caps for NTH to avoid costly counting
     # and to keep objectives broad and fast to generate.
 
+    def ordered_game_choices(self) -> List[str]:
+        """Concrete games for every (ordering, NTH) pair over the filtered library."""
+        self._ensure_computed()
+        choices: List[str] = []
+        for ordering in _PLAYNITE_ORDERINGS:
+            for n, i in enumerate(self._index.first_in_order(ordering, self._selected_ids, 10), 1):
+                choices.append(
+                    f"{self._index.display_name(i)} (your {self._ordinal(n)} {ordering} Playnite library game)"
+                )
+        return choices
+
+    def ordered_attribute_game_choices(self) -> List[str]:
+        """One concrete game for a randomly drawn (attribute value, ordering, NTH) triple.
+
+        The triple is drawn first and only its game is resolved through the rank
+        index, rather than rendering every combination over the filtered library.
+        """
+        self._ensure_computed()
+        index = self._index
+        attribute_values = [
+            (attr_label, kind, value)
+            for attr_label, kind, values in (
+                ("tag", "Tags", self._tags),
+                ("genre", "Genres", self._genres),
+                ("feature", "Features", self._features),
+                ("platform", "Platforms", self._platforms),
+                ("category", "Categories", self._cats),
+                ("source", "source", self._sources),
+            )
+            for value in sorted(values)
+        ]
+        if not attribute_values:
+            return []
+        orderings = list(_PLAYNITE_ORDERINGS)
+        for _ in range(_PLAYNITE_ORDERED_CHOICE_ATTEMPTS):
+            attr_label, kind, value = self.random.choice(attribute_values)
+            ordering = self.random.choice(orderings)
+            subset = index.attributes[kind][value] & self._selected_ids
+            n = self.random.randint(1, min(10, len(subset)))
+            i = index.nth_in_order(ordering, subset, n)
+            # Games without the ordering's sort key are unranked; draw again
+            if i is not None:
+                return [
+                    f"{index.display_name(i)} (your {self._ordinal(n)} {ordering} "
+                    f"Playnite library game with the {value} {attr_label})"
+                ]
+        return []
+
     def _ordinal(self, n: int) -> str:
         # Grammar-correct ordinal: 1st, 2nd, 3rd, 4th, ... including 11th/12th/13th exceptions
         if 10 <= n % 100 <= 20:
@@ -746,21 +767,33 @@ class PlayniteLibraryHolder:
         self._printed_filter_result = False
         # Print a one-time notice if JSON is missing/unreadable so we don't spam logs
         self._missing_ok_notice_printed = False
-    
+        # Reuse counters for the most recent incremental refresh
+        self._refresh_stats: Dict[str, int] = {"reused": 0, "normalized": 0}
+
     @functools.lru_cache(maxsize=None)
-    def games(self, json_path: str) -> List[Dict[str, Any]]:
+    def columns(self, json_path: str) -> "_PlayniteLibraryColumns":
+        """Load the library once per path into a compact columnar store.
+
+        Normalized records are streamed straight into the columns, so no list of
+        normalized dicts is ever held for the whole library.
+        """
         # If the JSON cannot be found or read, treat as empty gracefully
         try:
-            normalized = self._read_and_normalize(json_path)
+            try:
+                columns = self._load_columns(json_path)
+            except _PlayniteCacheError as e:
+                # The unreadable cache has been removed; parse the export itself
+                print(f"[Playnite] Ignoring unreadable library cache: {e}")
+                columns = self._load_columns(json_path)
         except Exception as e:
             if not self._missing_ok_notice_printed:
                 print(f"[Playnite] No library JSON found or unreadable at '{json_path}': {e}. Skipping Playnite objectives.")
                 self._missing_ok_notice_printed = True
-            return []
+            return _PlayniteLibraryColumns()
         # Print distinct elements only once per session
         if not self._printed_elements:
             self._printed_elements = True
-            self._print_distinct_elements_from_data(normalized)
+            self._print_library_statistics(columns)
             # Print filter summary after statistics, only once per session
             from os import environ
             min_time_played = int(environ.get("PLAYNITE_LIBRARY_MIN_TIME_PLAYED", 0))
@@ -779,240 +812,252 @@ class PlayniteLibraryHolder:
                 f"min_user={min_user_score}, min_critic={min_critic_score}, min_community={min_community_score}, "
                 f"excluded_statuses={excluded_statuses}, excluded_games={excluded_games}"
             )
-        return normalized
+        return columns
+
+    def _load_columns(self, json_path: str) -> "_PlayniteLibraryColumns":
+        return _PlayniteLibraryColumns.from_records(self._iter_library(json_path))
     
-    def _print_distinct_elements_from_data(self, normalized: List[Dict[str, Any]]):
-        """Extract and print distinct elements directly from normalized data to avoid recursion."""
-        tags: Set[str] = set()
-        genres: Set[str] = set()
-        features: Set[str] = set()
-        platforms: Set[str] = set()
-        categories: Set[str] = set()
-        series: Set[str] = set()
-        sources: Set[str] = set()
-        years: Set[int] = set()
-
-        for g in normalized:
-            # Tags
-            for tag in g.get("Tags") or []:
-                if isinstance(tag, dict) and "Name" in tag:
-                    tags.add(tag["Name"])
-                elif isinstance(tag, str):
-                    tags.add(tag)
-
-            # Genres
-            for genre in g.get("Genres") or []:
-                if isinstance(genre, dict) and "Name" in genre:
-                    genres.add(genre["Name"])
-                elif isinstance(genre, str):
-                    genres.add(genre)
-
-            # Features
-            for feat in g.get("Features") or []:
-                if isinstance(feat, dict) and "Name" in feat:
-                    features.add(feat["Name"])
-                elif isinstance(feat, str):
-                    features.add(feat)
-
-            # Platforms
-            for plat in g.get("Platforms") or []:
-                if isinstance(plat, dict) and "Name" in plat:
-                    platforms.add(plat["Name"])
-                elif isinstance(plat, str):
-                    platforms.add(plat)
-
-            # Categories
-            for cat in g.get("Categories") or []:
-                if isinstance(cat, dict) and "Name" in cat:
-                    categories.add(cat["Name"])
-                elif isinstance(cat, str):
-                    categories.add(cat)
-
-            # Sources (normalized key)
-            src = g.get("source")
-            if src:
-                sources.add(src)
-
-            # Series (can be a list of series objects, a single dict, a string, or None)
-            ser = g.get("Series")
-            if isinstance(ser, list):
-                for s in ser:
-                    if isinstance(s, dict) and "Name" in s:
-                        series.add(s["Name"])
-                    elif isinstance(s, str) and s:
-                        series.add(s)
-            elif isinstance(ser, dict) and "Name" in ser:
-                series.add(ser["Name"])
-            elif isinstance(ser, str) and ser:
-                series.add(ser)
-
-            # Years (normalized key)
-            year = g.get("release_year", 0)
-            try:
-                year_int = int(year)
-                if year_int:
-                    years.add(year_int)
-            except (ValueError, TypeError):
-                pass
+    @functools.lru_cache(maxsize=None)
+    def index(self, json_path: str) -> "_PlayniteLibraryIndex":
+        """Inverted attribute index over the columnar library, built once per path."""
+        return _PlayniteLibraryIndex(self.columns(json_path))
+
+    def _print_library_statistics(self, columns: "_PlayniteLibraryColumns"):
+        """Print distinct attribute counts straight from the columnar store."""
+        def distinct(kind: str) -> int:
+            return len(set(columns.values[kind]))
+
+        sources = {sid for sid in columns.string_columns["source"] if sid >= 0 and columns.strings[sid]}
+        years = {year for year in columns.numeric["release_year"] if year}
 
         print("\n=== Playnite Library Statistics (Before Filtering) ===")
-        print(f"Tags: {len(tags)}")
-        print(f"Genres: {len(genres)}")
-        print(f"Features: {len(features)}")
-        print(f"Platforms: {len(platforms)}")
-        print(f"Categories: {len(categories)}")
+        print(f"Tags: {distinct('Tags')}")
+        print(f"Genres: {distinct('Genres')}")
+        print(f"Features: {distinct('Features')}")
+        print(f"Platforms: {distinct('Platforms')}")
+        print(f"Categories: {distinct('Categories')}")
         print(f"Sources: {len(sources)}")
-        print(f"Series: {len(series)}")
+        print(f"Series: {distinct('Series')}")
         print(f"Years: {len(years)}")
-        print(f"Total Games: {len(normalized)}")
+        print(f"Total Games: {columns.count}")
         print("=" * 55 + "\n")
 
-    def _detect_text_encoding(self, path: Path) -> str:
-        """Detect basic text encoding using BOM, defaulting to UTF-8."""
-        try:
-            with path.open("rb") as f:
-                bom = f.read(4)
-        except Exception:
-            return "utf-8"
+    def _sniff_export(self, path: Path) -> Tuple[str, str, bool]:
+        """Pick one decoding strategy from the first few KB of an export.
 
-        if bom.startswith(b"\xff\xfe\x00\x00") or bom.startswith(b"\x00\x00\xfe\xff"):
-            return "utf-32"
-        if bom.startswith(b"\xff\xfe") or bom.startswith(b"\xfe\xff"):
-            return "utf-16"
-        if bom.startswith(b"\xef\xbb\xbf"):
-            return "utf-8-sig"
-        return "utf-8"
+        Returns (encoding, format, clean) where format is "json", "ndjson" or
+        "stream" and clean is False when the sample has bytes invalid in the chosen
+        encoding. The encoding comes from the BOM, or from the NUL-byte layout for
+        BOM-less UTF-16. A leading JSON object followed by another object on a new
+        line marks NDJSON. When the leading object does not end inside the sample
+        (a large first record or a wrapper dict) the format is "stream", since the
+        streaming decoder tells the two apart as it reads.
+        """
+        with path.open("rb") as f:
+            sample = f.read(_PLAYNITE_SNIFF_BYTES)
+            at_eof = len(sample) < _PLAYNITE_SNIFF_BYTES
+
+        if sample.startswith(b"\xff\xfe\x00\x00") or sample.startswith(b"\x00\x00\xfe\xff"):
+            encoding = "utf-32"
+        elif sample.startswith(b"\xff\xfe") or sample.startswith(b"\xfe\xff"):
+            encoding = "utf-16"
+        elif sample.startswith(b"\xef\xbb\xbf"):
+            encoding = "utf-8-sig"
+        elif len(sample) >= 2 and sample[0] == 0 and sample[1] != 0:
+            encoding = "utf-16-be"
+        elif len(sample) >= 2 and sample[0] != 0 and sample[1] == 0:
+            encoding = "utf-16-le"
+        else:
+            encoding = "utf-8"
 
-    def _read_and_normalize(self, json_path: str) -> List[Dict[str, Any]]:
+        # Trim to whole code units so a multi-byte character cut by the sample
+        # boundary does not look like a decoding error
+        try:
+            text = codecs.getincrementaldecoder(encoding)().decode(sample, final=at_eof)
+            clean = True
+        except UnicodeDecodeError:
+            text = sample.decode(encoding, errors="replace")
+            clean = False
+
+        fmt = "json"
+        body = text.lstrip()
+        if body.startswith("{"):
+            try:
+                first, end = json.JSONDecoder().raw_decode(body)
+            except ValueError:
+                first, end = None, -1
+            rest = body[end:].lstrip(" \t\r") if end >= 0 else ""
+            if end < 0 or (not rest.strip() and not at_eof):
+                fmt = "stream"
+            elif isinstance(first, dict) and rest.startswith("\n") and rest.lstrip().startswith("{"):
+                fmt = "ndjson"
+        return encoding, fmt, clean
+
+    def _iter_library(self, json_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield the normalized records of a library export one at a time.
+
+        An unchanged export is streamed from the normalized cache; otherwise the
+        export is parsed and each record is written through to a fresh cache.
+        """
         if not json_path:
             raise RuntimeError(
                 "No Playnite Library JSON path provided. Set playnite_library_json_path or PLAYNITE_LIBRARY_JSON."
             )
 
-        data: Any
         if json_path.lower().startswith("http://") or json_path.lower().startswith("https://"):
-            print(f"Fetching Playnite library JSON from URL: {json_path}...")
+            # Download (or revalidate) into the local URL cache, then load that file
+            # through the local path so streaming and the normalized cache apply
+            yield from self._iter_library(str(self._fetch_url_export(json_path)))
+            return
+
+        path = Path(json_path).expanduser()
+        # If a folder was provided, look for games.json inside it
+        if path.is_dir():
+            candidate = path / "games.json"
+            if candidate.exists():
+                path = candidate
+            else:
+                raise RuntimeError(
+                    f"Provided folder '{path}' does not contain 'games.json'. Please place your export there or provide a file path."
+                )
+
+        if not path.exists():
+            raise RuntimeError(
+                f"Playnite Library JSON not found at '{path}'. Provide a folder containing 'games.json' or a direct file path."
+            )
+
+        cached, previous = self._load_normalized_cache(path)
+        if cached is not None:
+            yield from cached
+            return
+
+        # Incremental refresh: entries whose Id and Modified match the previous
+        # export are read back from the old cache instead of normalized again;
+        # removed Ids simply drop out
+        self._refresh_stats = {"reused": 0, "normalized": 0}
+        yield from self._write_normalized_cache(path, self._iter_local_normalized(path, previous))
+        if previous:
+            print(
+                f"[Playnite] Incremental refresh: reused {self._refresh_stats['reused']} unchanged games, "
+                f"normalized {self._refresh_stats['normalized']} new or modified"
+            )
+
+    def _fetch_url_export(self, url: str) -> Path:
+        """Return a local copy of a URL export, revalidating it with a conditional GET.
+
+        The body is streamed to disk in chunks (never held in memory) under the URL
+        cache directory, alongside the ETag/Last-Modified it was served with. An
+        unchanged remote answers 304 and the existing copy is reused; if the request
+        fails but a copy exists, the stale copy is used.
+        """
+        if requests is None:
+            raise RuntimeError("The 'requests' package is required to fetch HTTP URLs. Install it or use a local file path.")
+
+        cache_dir = _playnite_url_cache_dir()
+        stem = hashlib.sha1(url.encode("utf-8")).hexdigest()[:20]
+        body_path = cache_dir / f"{stem}.json"
+        meta_path = cache_dir / f"{stem}.meta.json"
+
+        meta: Dict[str, Any] = {}
+        headers: Dict[str, str] = {}
+        if body_path.exists() and meta_path.exists():
             try:
-                if requests is None:
-                    raise RuntimeError("The 'requests' package is required to fetch HTTP URLs. Install it or use a local file path.")
-                resp = requests.get(json_path, timeout=15)
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except Exception:
+                meta = {}
+            if meta.get("url") == url:
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+
+        print(f"Fetching Playnite library JSON from URL: {url}...")
+        tmp_path = body_path.with_name(body_path.name + ".tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with requests.get(url, headers=headers, timeout=15, stream=True) as resp:
+                if resp.status_code == 304 and headers:
+                    print("[Playnite] Remote library unchanged (HTTP 304); using cached download")
+                    return body_path
                 if resp.status_code != 200:
                     raise RuntimeError(f"HTTP {resp.status_code} fetching Playnite library JSON")
-                data = resp.json()
-            except Exception as e:
-                raise RuntimeError(f"Failed to fetch Playnite library JSON from URL: {e}")
-        else:
-            path = Path(json_path).expanduser()
-            # If a folder was provided, look for games.json inside it
-            if path.is_dir():
-                candidate = path / "games.json"
-                if candidate.exists():
-                    path = candidate
-                else:
-                    raise RuntimeError(
-                        f"Provided folder '{path}' does not contain 'games.json'. Please place your export there or provide a file path."
-                    )
-
-            if not path.exists():
-                raise RuntimeError(
-                    f"Playnite Library JSON not found at '{path}'. Provide a folder containing 'games.json' or a direct file path."
+                with tmp_path.open("wb") as f:
+                    for chunk in resp.iter_content(chunk_size=_PLAYNITE_STREAM_CHUNK_CHARS):
+                        f.write(chunk)
+                os.replace(tmp_path, body_path)
+                meta_path.write_text(
+                    json.dumps({
+                        "url": url,
+                        "etag": resp.headers.get("ETag"),
+                        "last_modified": resp.headers.get("Last-Modified"),
+                    }),
+                    encoding="utf-8",
                 )
+        except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            if body_path.exists():
+                print(f"[Playnite] Could not revalidate remote library ({e}); using cached download")
+                return body_path
+            raise RuntimeError(f"Failed to fetch Playnite library JSON from URL: {e}")
+        return body_path
+
+    def _iter_local_normalized(
+        self, path: Path, previous: "_PlaynitePreviousRecords | None" = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse and normalize a local export, streaming large files.
+
+        previous is closed once parsing ends, before the new cache replaces the
+        file it reads from.
+        """
+        file_size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"Loading Playnite library from {path} ({file_size_mb:.1f} MB)...")
 
-            file_size_mb = path.stat().st_size / (1024 * 1024)
-            print(f"Loading Playnite library from {path} ({file_size_mb:.1f} MB)...")
-            
-            if file_size_mb > 100:
-                print(f"[Playnite] Large library detected ({file_size_mb:.1f} MB). This may take a moment...")
-            
-            # Read JSON content; allow either a list of games or a dict with a games collection
-            # Be permissive with encodings and formats (Playnite's games.json can be NDJSON)
-            load_error: Exception | None = None
-            data = None
-            detected_encoding = self._detect_text_encoding(path)
-            # 1) Try JSON load with detected encoding, then common UTF-8 fallbacks
-            for enc in (detected_encoding, "utf-8", "utf-8-sig"):
-                try:
-                    with path.open("r", encoding=enc) as f:
-                        data = json.load(f)
-                        load_error = None
-                        break
-                except Exception as e1:
-                    load_error = e1
-                    # Store more detailed error info for large files
-                    if file_size_mb > 100:
-                        print(f"[Playnite] Encoding '{enc}' failed: {type(e1).__name__}: {str(e1)[:200]}")
-            # 3) If still failing, attempt NDJSON streaming, then tolerant full-text JSON
-            if data is None:
-                # For very large files (>200MB), skip expensive string fallbacks
-                # as they'll likely cause memory issues
-                if file_size_mb > 200:
-                    error_detail = f"{type(load_error).__name__}: {load_error}" if load_error else "Unknown parse error"
-                    raise RuntimeError(
-                        f"Cannot parse large JSON file ({file_size_mb:.1f} MB). "
-                        f"Error: {error_detail}. "
-                        f"Ensure the file is valid JSON and not corrupted."
-                    )
-                
-                try:
-                    with path.open("r", encoding=detected_encoding, errors="replace") as f:
-                        first_line = ""
-                        for line in f:
-                            stripped = line.strip()
-                            if stripped:
-                                first_line = stripped
-                                break
-
-                        # NDJSON typically has one full JSON object per non-empty line
-                        if first_line.startswith("{") and first_line.endswith("}"):
-                            ndjson_items: List[Dict[str, Any]] = []
-                            try:
-                                ndjson_items.append(json.loads(first_line))
-                            except Exception:
-                                ndjson_items = []
-
-                            if ndjson_items:
-                                for line in f:
-                                    stripped = line.strip()
-                                    if not stripped:
-                                        continue
-                                    try:
-                                        ndjson_items.append(json.loads(stripped))
-                                    except Exception:
-                                        ndjson_items = []
-                                        break
-
-                            if ndjson_items:
-                                data = ndjson_items
-                                load_error = None
-
-                        # Fallback to tolerant full-text JSON parse
-                        if data is None:
-                            f.seek(0)
-                            raw = f.read().strip()
-                            if raw.startswith("{") or raw.startswith("["):
-                                try:
-                                    data = json.loads(raw)
-                                    load_error = None
-                                except Exception as e3:
-                                    load_error = e3
-                except Exception as e4:
-                    load_error = e4
-
-            if data is None:
-                if load_error:
-                    error_type = type(load_error).__name__
-                    error_detail = str(load_error)[:500]  # Limit error message length
-                    error_msg = f"{error_type}: {error_detail}" if error_detail else error_type
-                else:
-                    error_msg = "Unknown error - file may be empty or severely malformed"
-                raise RuntimeError(f"Failed to read Playnite library JSON ({file_size_mb:.1f} MB): {error_msg}")
+        if file_size_mb > 100:
+            print(f"[Playnite] Large library detected ({file_size_mb:.1f} MB). This may take a moment...")
 
+        encoding, fmt, clean = self._sniff_export(path)
+        if not clean:
+            print(f"[Playnite] Export is not valid {encoding}; undecodable bytes will be replaced")
+
+        # Single pass: NDJSON, undecided and large files go through the streaming
+        # decoder (which also walks NDJSON records); everything else is one json.load. Undecodable
+        # bytes are replaced rather than retried under other encodings.
+        try:
+            if fmt == "ndjson" and self._ndjson_workers(file_size_mb, encoding) > 1:
+                records: Iterable[Dict[str, Any]] = self._read_ndjson_parallel(
+                    path, encoding, self._ndjson_workers(file_size_mb, encoding), previous
+                )
+            elif fmt != "json" or self._use_streaming(file_size_mb):
+                records = self.iter_normalized(path, encoding, previous)
+            else:
+                with path.open("r", encoding=encoding, errors="replace") as f:
+                    data = json.load(f)
+                records = self._normalize_data(data, previous)
+            yield from records
+        except _PlayniteCacheError:
+            raise
+        except Exception as e:
+            error_type = type(e).__name__
+            error_detail = str(e)[:500]  # Limit error message length
+            error_msg = f"{error_type}: {error_detail}" if error_detail else error_type
+            raise RuntimeError(f"Failed to read Playnite library JSON ({file_size_mb:.1f} MB): {error_msg}")
+        finally:
+            if previous is not None:
+                previous.close()
+
+    def _normalize_data(
+        self, data: Any, previous: "_PlaynitePreviousRecords | None" = None
+    ) -> List[Dict[str, Any]]:
+        """Extract the games list from a parsed export and normalize every entry."""
         games_raw: List[Dict[str, Any]]
         if isinstance(data, list):
             games_raw = data
         elif isinstance(data, dict):
             # Common keys used by exporters
-            for key in ("Games", "games", "Items", "items", "Library", "library"):
+            for key in _PLAYNITE_GAMES_KEYS:
                 if key in data and isinstance(data[key], list):
                     games_raw = data[key]  # type: ignore[assignment]
                     break
@@ -1026,73 +1071,860 @@ class PlayniteLibraryHolder:
         # Normalize game entries
         normalized: List[Dict[str, Any]] = []
         for g in games_raw:
-            # Name - exact field from Playnite JSON
-            name = g.get("Name")
-            if not name:
-                # Skip entries without a name
+            entry = self._normalize_or_reuse(g, previous)
+            if entry is not None:
+                normalized.append(entry)
+
+        return normalized
+
+    # -------- Persistent normalized cache --------
+    def _cache_enabled(self) -> bool:
+        flag = (environ.get("PLAYNITE_LIBRARY_CACHE") or "").strip().lower()
+        return flag not in ("0", "false", "no", "off")
+
+    def _cache_path(self, path: Path) -> Path:
+        """Cache file stored next to the export (e.g. games.json -> games.json.kmkcache)."""
+        return path.with_name(path.name + _PLAYNITE_CACHE_SUFFIX)
+
+    def _cache_key(self, path: Path) -> Dict[str, Any]:
+        """Identify an export by path, size, mtime and a sampled content fingerprint.
+
+        The fingerprint hashes the first and last _PLAYNITE_FINGERPRINT_BYTES so an
+        unchanged library is recognized without reading the whole file.
+        """
+        stat = path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(stat.st_size).encode("ascii"))
+        with path.open("rb") as f:
+            digest.update(f.read(_PLAYNITE_FINGERPRINT_BYTES))
+            if stat.st_size > 2 * _PLAYNITE_FINGERPRINT_BYTES:
+                f.seek(-_PLAYNITE_FINGERPRINT_BYTES, 2)
+                digest.update(f.read(_PLAYNITE_FINGERPRINT_BYTES))
+        return {
+            "version": _PLAYNITE_CACHE_VERSION,
+            "path": str(path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "fingerprint": digest.hexdigest(),
+        }
+
+    def _load_normalized_cache(
+        self, path: Path
+    ) -> Tuple[Iterator[Dict[str, Any]] | None, "_PlaynitePreviousRecords | None"]:
+        """Return (records, previous) from the cache next to the export.
+
+        records streams the cached records when the export is unchanged, else it is
+        None. When the cache belongs to an older export of the same file, previous
+        maps its Ids to their Modified stamps and line offsets so the reload can
+        read back the entries that were not modified.
+        """
+        if not self._cache_enabled():
+            return None, None
+        cache_path = self._cache_path(path)
+        if not cache_path.exists():
+            return None, None
+        try:
+            key = self._cache_key(path)
+            with cache_path.open("r", encoding="utf-8") as f:
+                # Line 1 is the key; every following line is one normalized record
+                cached_key = json.loads(f.readline() or "null")
+            if not isinstance(cached_key, dict):
+                return None, None
+            if cached_key == key:
+                return self._iter_cached_records(cache_path), None
+            if cached_key.get("version") != key["version"] or cached_key.get("path") != key["path"]:
+                return None, None
+            return None, _PlaynitePreviousRecords(cache_path)
+        except Exception as e:
+            print(f"[Playnite] Ignoring unreadable library cache '{cache_path.name}': {type(e).__name__}: {e}")
+            return None, None
+
+    def _iter_cached_records(self, cache_path: Path) -> Iterator[Dict[str, Any]]:
+        """Stream records from a cache whose key matched; a bad line removes the cache."""
+        count = 0
+        try:
+            with cache_path.open("r", encoding="utf-8") as f:
+                f.readline()
+                for line in f:
+                    if line.strip():
+                        count += 1
+                        yield json.loads(line)
+        except (OSError, ValueError) as e:
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+            raise _PlayniteCacheError(f"'{cache_path.name}': {type(e).__name__}: {e}")
+        print(f"Loaded Playnite library from cache {cache_path} ({count} games)")
+
+    def _write_normalized_cache(self, path: Path, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield records while persisting them next to the export as JSON lines.
+
+        JSON rather than pickle, so a cache file planted next to an export can at
+        worst be rejected, never executed. The cache only replaces the previous one
+        once every record has been written; write failures are non-fatal.
+        """
+        if not self._cache_enabled():
+            yield from records
+            return
+        cache_path = self._cache_path(path)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        f: TextIO | None = None
+        try:
+            f = tmp_path.open("w", encoding="utf-8")
+            f.write(json.dumps(self._cache_key(path)) + "\n")
+        except Exception as e:
+            print(f"[Playnite] Could not write library cache '{cache_path}': {type(e).__name__}: {e}")
+            if f is not None:
+                f.close()
+                f = None
+
+        complete = False
+        try:
+            for record in records:
+                if f is not None:
+                    try:
+                        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    except Exception as e:
+                        print(f"[Playnite] Could not write library cache '{cache_path}': {type(e).__name__}: {e}")
+                        f.close()
+                        f = None
+                yield record
+            complete = True
+        finally:
+            if f is not None:
+                f.close()
+                if complete:
+                    try:
+                        os.replace(tmp_path, cache_path)
+                    except OSError as e:
+                        print(f"[Playnite] Could not write library cache '{cache_path}': {type(e).__name__}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _use_streaming(self, file_size_mb: float) -> bool:
+        """Decide whether a local export should be parsed incrementally.
+
+        PLAYNITE_LIBRARY_STREAMING=1 forces streaming, =0 disables it; otherwise
+        exports larger than _PLAYNITE_STREAMING_THRESHOLD_MB are streamed.
+        """
+        flag = (environ.get("PLAYNITE_LIBRARY_STREAMING") or "").strip().lower()
+        if flag in ("1", "true", "yes", "on"):
+            return True
+        if flag in ("0", "false", "no", "off"):
+            return False
+        return file_size_mb > _PLAYNITE_STREAMING_THRESHOLD_MB
+
+    def _ndjson_workers(self, file_size_mb: float, encoding: str) -> int:
+        """Process count for parallel NDJSON decoding; 1 means decode serially.
+
+        PLAYNITE_LIBRARY_WORKERS overrides the CPU count. Only UTF-8 exports above
+        _PLAYNITE_PARALLEL_THRESHOLD_MB qualify, since chunks are split on b"\\n".
+        """
+        if encoding not in ("utf-8", "utf-8-sig") or file_size_mb < _PLAYNITE_PARALLEL_THRESHOLD_MB:
+            return 1
+        try:
+            workers = int(environ.get("PLAYNITE_LIBRARY_WORKERS") or (os.cpu_count() or 1))
+        except ValueError:
+            workers = os.cpu_count() or 1
+        return max(1, workers)
+
+    def _read_ndjson_parallel(
+        self, path: Path, encoding: str, workers: int, previous: "_PlaynitePreviousRecords | None" = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Decode and normalize an NDJSON export in a process pool.
+
+        The file is memory-mapped only to find newline-aligned chunk boundaries;
+        each worker reads and normalizes its own byte range, and results are merged
+        in file order. Workers get the previous Id -> Modified map once, at start-up,
+        and return just the Id of an unchanged entry, which is then read back from
+        previous here. Falls back to the serial streaming reader if a pool cannot
+        be started.
+        """
+        size = path.stat().st_size
+        start = 3 if encoding == "utf-8-sig" else 0
+        chunk_size = max(1, (size - start) // (workers * 4))
+        bounds: List[Tuple[int, int]] = []
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while start < size:
+                end = mm.find(b"\n", min(start + chunk_size, size - 1))
+                end = size if end == -1 else end + 1
+                bounds.append((start, end))
+                start = end
+
+        modified_by_id = previous.modified_by_id() if previous else {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_set_ndjson_previous, initargs=(modified_by_id,)
+            ) as pool:
+                chunks = list(pool.map(_normalize_ndjson_chunk, [str(path)] * len(bounds), *zip(*bounds)))
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+            print(f"[Playnite] Parallel NDJSON decoding unavailable ({type(e).__name__}: {e}); decoding serially...")
+            yield from self.iter_normalized(path, encoding, previous)
+            return
+
+        print(f"[Playnite] Decoded NDJSON export in {len(bounds)} chunks across {workers} processes")
+        for chunk in chunks:
+            for item in chunk:
+                if isinstance(item, str):
+                    # Unchanged entry: the worker matched its Id and Modified stamp
+                    self._refresh_stats["reused"] += 1
+                    yield previous.get(item, modified_by_id[item])
+                else:
+                    if previous:
+                        self._refresh_stats["normalized"] += 1
+                    yield item
+
+    def iter_normalized(
+        self, path: Path, encoding: str = "utf-8", previous: "_PlaynitePreviousRecords | None" = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream normalized game records from a local export one object at a time.
+
+        Accepts a top-level array, a dict wrapping the games list (Games/Items/Library),
+        or NDJSON. Only one raw game object is held in memory at any point.
+        """
+        with path.open("r", encoding=encoding, errors="replace") as f:
+            for g in _PlayniteJsonStream(f).iter_games():
+                entry = self._normalize_or_reuse(g, previous)
+                if entry is not None:
+                    yield entry
+
+    def _normalize_or_reuse(self, g: Any, previous: "_PlaynitePreviousRecords | None") -> Dict[str, Any] | None:
+        """Reuse the previous normalized record when the entry's Id and Modified are unchanged."""
+        if previous and isinstance(g, dict):
+            prev = previous.get(str(g.get("Id", "")), g.get("Modified"))
+            if prev is not None:
+                self._refresh_stats["reused"] += 1
+                return prev
+        entry = self._normalize_game(g)
+        if entry is not None and previous:
+            self._refresh_stats["normalized"] += 1
+        return entry
+
+    def _normalize_game(self, g: Any) -> Dict[str, Any] | None:
+        """Normalize a single raw Playnite game object, or return None to skip it."""
+        if not isinstance(g, dict):
+            return None
+
+        # Name - exact field from Playnite JSON
+        name = g.get("Name")
+        if not name:
+            # Skip entries without a name
+            return None
+
+        # IDs - Playnite uses GUID strings in Id field
+        gid = g.get("Id", "")
+
+        # Playtime - stored in seconds in Playnite JSON
+        playtime_seconds = g.get("Playtime", 0)
+        playtime_minutes = int(playtime_seconds) // 60
+
+        # Source - object with Name field (e.g., Steam, GOG, itch.io)
+        source_name = None
+        source_obj = g.get("Source")
+        if isinstance(source_obj, dict):
+            source_name = source_obj.get("Name")
+
+        # Completion status - object with Name field
+        completion_status = None
+        completion_obj = g.get("CompletionStatus")
+        if isinstance(completion_obj, dict):
+            completion_status = completion_obj.get("Name")
+
+        # Release year (int)
+        release_year = int(g.get("ReleaseYear", 0) or 0)
+
+        # Scores
+        user_score = int(g.get("UserScore", 0) or 0)
+        critic_score = int(g.get("CriticScore", 0) or 0)
+        community_score = int(g.get("CommunityScore", 0) or 0)
+
+        # Additional attributes commonly present in Playnite exports
+        tags_list = g.get("Tags", [])
+        genres_list = g.get("Genres", [])
+        features_list = g.get("Features", [])
+        platforms_list = g.get("Platforms", [])
+        categories_list = g.get("Categories", [])
+        series_obj = g.get("Series")
+        favorite_flag = bool(g.get("Favorite", False))
+        added_date = g.get("Added")
+        modified_date = g.get("Modified")
+
+        return {
+            "name": str(name),
+            "id": str(gid),
+            "playtime_minutes": playtime_minutes,
+            "source": str(source_name) if source_name else None,
+            "completion_status": str(completion_status) if completion_status else None,
+            "release_year": release_year,
+            "user_score": user_score,
+            "critic_score": critic_score,
+            "community_score": community_score,
+            # Pass-through attributes for helper-based filtering
+            "Tags": tags_list,
+            "Genres": genres_list,
+            "Features": features_list,
+            "Platforms": platforms_list,
+            "Categories": categories_list,
+            "Series": series_obj,
+            "Favorite": favorite_flag,
+            "Added": added_date,
+            "Modified": modified_date,
+        }
+
+
+class _PlayniteCacheError(RuntimeError):
+    """The normalized cache matched its export but could not be read back."""
+
+
+class _PlaynitePreviousRecords:
+    """Records of an older normalized cache, looked up by Id during a refresh.
+
+    Only Id -> (Modified, byte offset) is held in memory; a reused record is read
+    back from the cache file with a seek. Records without an Id or Modified stamp
+    are never reused. A record that cannot be read back removes the cache and
+    raises _PlayniteCacheError, so the load is retried from the export alone.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Tuple[Any, int]] = {}
+        self._file: BinaryIO | None = None
+        with cache_path.open("rb") as f:
+            offset = len(f.readline())
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    gid, modified = rec.get("id"), rec.get("Modified")
+                    if gid and modified is not None:
+                        self.entries[gid] = (modified, offset)
+                offset += len(line)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def modified_by_id(self) -> Dict[str, Any]:
+        return {gid: modified for gid, (modified, _) in self.entries.items()}
+
+    def get(self, gid: str, modified: Any) -> Dict[str, Any] | None:
+        """The previous record for gid if its Modified stamp equals modified, else None."""
+        entry = self.entries.get(gid)
+        if entry is None or modified is None or entry[0] != modified:
+            return None
+        try:
+            if self._file is None:
+                self._file = self.cache_path.open("rb")
+            self._file.seek(entry[1])
+            return json.loads(self._file.readline())
+        except (OSError, ValueError) as e:
+            self.close()
+            try:
+                self.cache_path.unlink()
+            except OSError:
+                pass
+            raise _PlayniteCacheError(f"'{self.cache_path.name}': {type(e).__name__}: {e}")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _playnite_url_cache_dir() -> Path:
+    """Where URL exports are downloaded; PLAYNITE_LIBRARY_CACHE_DIR overrides the default."""
+    configured = (environ.get("PLAYNITE_LIBRARY_CACHE_DIR") or "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "keymasters_keep" / "playnite"
+
+def _attribute_names(value: Any) -> List[str]:
+    """Names from a Playnite attribute field: a list of {Name} dicts/strings, a single dict, or a string."""
+    if isinstance(value, list):
+        names = []
+        for v in value:
+            if isinstance(v, dict) and "Name" in v:
+                names.append(v["Name"])
+            elif isinstance(v, str) and v:
+                names.append(v)
+        return names
+    if isinstance(value, dict) and "Name" in value:
+        return [value["Name"]]
+    if isinstance(value, str) and value:
+        return [value]
+    return []
+
+
+class _PlayniteLibraryColumns:
+    """Compact columnar store for the hot fields of a normalized Playnite library.
+
+    Numeric fields live in typed arrays, every string (names, ids, sources,
+    statuses, attribute values, dates) is interned once in a shared table, and the
+    multi-valued attributes use CSR-style offset/value arrays. Game i is row i of
+    every column; record(i) rebuilds one normalized dict on demand, with attribute
+    lists of plain names rather than the export's {Name} objects.
+    """
+
+    NUMERIC = ("playtime_minutes", "release_year", "user_score", "critic_score", "community_score")
+    STRINGS = ("name", "id", "source", "completion_status", "Added", "Modified")
+    MULTI_VALUED = ("Tags", "Genres", "Features", "Platforms", "Categories", "Series")
+
+    def __init__(self):
+        self.count = 0
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.numeric: Dict[str, array] = {field: array("q") for field in self.NUMERIC}
+        # Index into self.strings, or -1 for None
+        self.string_columns: Dict[str, array] = {field: array("l") for field in self.STRINGS}
+        self.favorite = array("b")
+        # Values of game i for a kind are values[offsets[i]:offsets[i + 1]]
+        self.offsets: Dict[str, array] = {kind: array("L", [0]) for kind in self.MULTI_VALUED}
+        self.values: Dict[str, array] = {kind: array("L") for kind in self.MULTI_VALUED}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "_PlayniteLibraryColumns":
+        columns = cls()
+        for record in records:
+            columns.append(record)
+        return columns
+
+    def intern(self, value: str) -> int:
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = len(self.strings)
+            self._string_ids[value] = sid
+            self.strings.append(value)
+        return sid
+
+    def append(self, record: Dict[str, Any]) -> None:
+        for field in self.NUMERIC:
+            try:
+                self.numeric[field].append(int(record.get(field, 0) or 0))
+            except (ValueError, TypeError):
+                self.numeric[field].append(0)
+        for field in self.STRINGS:
+            value = record.get(field)
+            self.string_columns[field].append(self.intern(str(value)) if value is not None else -1)
+        self.favorite.append(1 if record.get("Favorite") else 0)
+        for kind in self.MULTI_VALUED:
+            values = self.values[kind]
+            values.extend(self.intern(name) for name in _attribute_names(record.get(kind)))
+            self.offsets[kind].append(len(values))
+        self.count += 1
+
+    def string(self, field: str, i: int) -> str | None:
+        sid = self.string_columns[field][i]
+        return self.strings[sid] if sid >= 0 else None
+
+    def attribute_values(self, kind: str, i: int) -> List[str]:
+        offsets = self.offsets[kind]
+        return [self.strings[sid] for sid in self.values[kind][offsets[i]:offsets[i + 1]]]
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Rebuild the normalized dict for game i (attribute lists hold plain names)."""
+        record: Dict[str, Any] = {field: self.string(field, i) for field in self.STRINGS}
+        record["id"] = record["id"] or ""
+        for field in self.NUMERIC:
+            record[field] = self.numeric[field][i]
+        for kind in self.MULTI_VALUED:
+            record[kind] = self.attribute_values(kind, i)
+        record["Favorite"] = bool(self.favorite[i])
+        return record
+
+
+class _PlayniteLibraryIndex:
+    """Inverted index over a columnar Playnite library.
+
+    Games are identified by their row in the columnar store. Multi-valued
+    attributes map each value to the frozenset of game ids that carry it, and the
+    numeric columns keep ids sorted by value so range filters become a bisect plus
+    a slice. Names and ids, which are almost always unique, map straight to a row
+    instead of a one-element set. Built once per library and shared by every
+    PlayniteLibraryGame.
+    """
+
+    def __init__(self, columns: _PlayniteLibraryColumns):
+        self.columns = columns
+        self.all_ids: frozenset = frozenset(range(columns.count))
+
+        postings: Dict[str, Dict[Any, Set[int]]] = {
+            kind: {} for kind in columns.MULTI_VALUED + ("source", "completion_status", "release_year")
+        }
+        for kind in columns.MULTI_VALUED:
+            kind_postings = postings[kind]
+            offsets = columns.offsets[kind]
+            values = columns.values[kind]
+            for i in range(columns.count):
+                for sid in values[offsets[i]:offsets[i + 1]]:
+                    kind_postings.setdefault(columns.strings[sid], set()).add(i)
+        for kind in ("source", "completion_status"):
+            kind_postings = postings[kind]
+            for i, sid in enumerate(columns.string_columns[kind]):
+                if sid >= 0:
+                    kind_postings.setdefault(columns.strings[sid], set()).add(i)
+        for i, year in enumerate(columns.numeric["release_year"]):
+            postings["release_year"].setdefault(year, set()).add(i)
+
+        # Name/id -> first row; the rare rows repeating a key are kept aside
+        self._key_rows: Dict[str, Dict[str, int]] = {"name": {}, "id": {}}
+        self._repeated_key_rows: Dict[str, Dict[str, List[int]]] = {"name": {}, "id": {}}
+        for kind, rows in self._key_rows.items():
+            repeated = self._repeated_key_rows[kind]
+            for i, sid in enumerate(columns.string_columns[kind]):
+                if sid >= 0:
+                    key = columns.strings[sid]
+                    if key in rows:
+                        repeated.setdefault(key, []).append(i)
+                    else:
+                        rows[key] = i
+
+        self.attributes: Dict[str, Dict[Any, frozenset]] = {
+            kind: {value: frozenset(ids) for value, ids in values.items()}
+            for kind, values in postings.items()
+        }
+
+        # Row ids sorted by each numeric column, with the matching sorted values
+        self._sorted_ids: Dict[str, array] = {}
+        self._sorted_values: Dict[str, array] = {}
+        for field, values in columns.numeric.items():
+            order = sorted(range(columns.count), key=values.__getitem__)
+            self._sorted_ids[field] = array("L", order)
+            self._sorted_values[field] = array("q", (values[i] for i in order))
+        self._ranks: Dict[str, array] = {}
+
+    def display_name(self, i: int) -> str:
+        name = self.columns.string("name", i) or ""
+        src = self.columns.string("source", i)
+        return f"{name} [Source: {src}]" if src else name
+
+    def ids_in_range(self, field: str, low: int | None = None, high: int | None = None) -> frozenset:
+        """Ids whose numeric field lies within [low, high] (either bound optional)."""
+        values = self._sorted_values[field]
+        start = bisect.bisect_left(values, low) if low is not None else 0
+        end = bisect.bisect_right(values, high) if high is not None else len(values)
+        return frozenset(self._sorted_ids[field][start:end])
+
+    def ids_with_any(self, kind: str, values: Any) -> frozenset:
+        """Union of the posting sets for the given attribute values."""
+        postings = self.attributes[kind]
+        result: Set[int] = set()
+        for value in values:
+            result.update(postings.get(value, ()))
+        return frozenset(result)
+
+    def rows_with_key(self, kind: str, keys: Any) -> frozenset:
+        """Rows whose name or id (kind) equals any of the given keys."""
+        rows = self._key_rows[kind]
+        repeated = self._repeated_key_rows[kind]
+        result: Set[int] = set()
+        for key in keys:
+            if key in rows:
+                result.add(rows[key])
+                result.update(repeated.get(key, ()))
+        return frozenset(result)
+
+    def filter(
+        self,
+        min_time_played: int = 0,
+        max_time_played: int = -1,
+        excluded_games: Set[str] | None = None,
+        excluded_statuses: Set[str] | None = None,
+        min_release_year: int = 0,
+        max_release_year: int = 9999,
+        min_user_score: int = 0,
+        min_critic_score: int = 0,
+        min_community_score: int = 0,
+    ) -> frozenset:
+        """Ids passing the PlayniteLibraryGame option filters, as set intersections."""
+        selected = self.all_ids
+        if min_time_played > 0 or max_time_played != -1:
+            selected &= self.ids_in_range(
+                "playtime_minutes",
+                min_time_played,
+                max_time_played if max_time_played != -1 else None,
+            )
+        if excluded_games:
+            selected -= self.rows_with_key("name", excluded_games)
+            selected -= self.rows_with_key("id", excluded_games)
+        if excluded_statuses:
+            selected -= self.ids_with_any("completion_status", excluded_statuses)
+        if min_release_year > 0 or max_release_year < 9999:
+            # Games without a release year are never excluded by the year filter
+            undated = self.attributes["release_year"].get(0, frozenset())
+            selected &= self.ids_in_range("release_year", min_release_year, max_release_year) | undated
+        for field, minimum in (
+            ("user_score", min_user_score),
+            ("critic_score", min_critic_score),
+            ("community_score", min_community_score),
+        ):
+            if minimum > 0:
+                selected &= self.ids_in_range(field, minimum)
+        return selected
+
+    def values_within(self, kind: str, selected: frozenset) -> Set[Any]:
+        """Attribute values carried by at least one of the selected games."""
+        if selected == self.all_ids:
+            return set(self.attributes[kind])
+        return {value for value, ids in self.attributes[kind].items() if not ids.isdisjoint(selected)}
+
+    def ranks(self, ordering: str) -> array:
+        """Rank of every game under an NTH ordering (see _PLAYNITE_ORDERINGS), built once.
+
+        Games missing the sort key (no Added date, no release year, unscored) have
+        no place in the ordering and get rank -1. Ties break by name, then row.
+        """
+        cached = self._ranks.get(ordering)
+        if cached is not None:
+            return cached
+        field, descending = _PLAYNITE_ORDERINGS[ordering]
+        columns = self.columns
+        if field == "name":
+            keys = [(columns.string("name", i) or "").casefold() for i in range(columns.count)]
+        elif field == "Added":
+            keys = [columns.string("Added", i) for i in range(columns.count)]
+        else:
+            keys = list(columns.numeric[field])
+        ranked = [i for i in range(columns.count) if keys[i]]
+        names = [(columns.string("name", i) or "").casefold() for i in range(columns.count)]
+        # Stable sorts: tie-break ascending by name, then order by the key
+        ranked.sort(key=names.__getitem__)
+        ranked.sort(key=keys.__getitem__, reverse=descending)
+        ranks = array("l", [-1]) * columns.count
+        for rank, i in enumerate(ranked):
+            ranks[i] = rank
+        self._ranks[ordering] = ranks
+        return ranks
+
+    def first_in_order(self, ordering: str, subset: Iterable[int], n: int) -> List[int]:
+        """The first n games of subset under an ordering, via the precomputed ranks."""
+        ranks = self.ranks(ordering)
+        return heapq.nsmallest(n, (i for i in subset if ranks[i] >= 0), key=ranks.__getitem__)
+
+    def nth_in_order(self, ordering: str, subset: Iterable[int], n: int) -> int | None:
+        """Row of the nth (1-based) game of subset under an ordering, or None if too few."""
+        first = self.first_in_order(ordering, subset, n)
+        return first[n - 1] if len(first) >= n else None
+
+
+class _PlayniteFilteredView:
+    """Filtered games and attribute sets for one (library, option filters) pair."""
+
+    __slots__ = ("index", "selected", "display", "attribute_sets", "years")
+
+    def __init__(self, index: _PlayniteLibraryIndex, selected: frozenset):
+        self.index = index
+        self.selected = selected
+        self.display: List[str] = [index.display_name(i) for i in sorted(selected)]
+        # Attribute sets: every indexed value whose posting set overlaps the selection
+        self.attribute_sets: Dict[str, Set[str]] = {
+            kind: index.values_within(kind, selected)
+            for kind in _PlayniteLibraryColumns.MULTI_VALUED + ("source",)
+        }
+        self.years: Set[int] = {y for y in index.values_within("release_year", selected) if y}
+
+
+def _playnite_filtered_view(json_path: str, filters: Tuple[Any, ...]) -> _PlayniteFilteredView:
+    """Return the shared filtered view for a library and normalized filter tuple.
+
+    Views live in a bounded LRU (_PLAYNITE_VIEW_CACHE_SIZE) so every game instance
+    with the same options, e.g. across players of a multiworld seed, reuses one
+    computation. The library is keyed by its path, which the holder loads once
+    per process.
+    """
+    key = (json_path, filters)
+    with _PLAYNITE_VIEW_CACHE_LOCK:
+        view = _PLAYNITE_VIEW_CACHE.get(key)
+        if view is not None:
+            _PLAYNITE_VIEW_CACHE.move_to_end(key)
+            return view
+
+    index = playnite_library.index(json_path) if json_path else _PlayniteLibraryIndex(_PlayniteLibraryColumns())
+    (min_time, max_time, excluded_games, excluded_statuses,
+     min_year, max_year, min_user, min_critic, min_community) = filters
+    # Filters are answered from the per-library index by set intersection
+    selected = index.filter(
+        min_time_played=min_time,
+        max_time_played=max_time,
+        excluded_games=excluded_games,
+        excluded_statuses=excluded_statuses,
+        min_release_year=min_year,
+        max_release_year=max_year,
+        min_user_score=min_user,
+        min_critic_score=min_critic,
+        min_community_score=min_community,
+    )
+    view = _PlayniteFilteredView(index, selected)
+
+    with _PLAYNITE_VIEW_CACHE_LOCK:
+        _PLAYNITE_VIEW_CACHE[key] = view
+        _PLAYNITE_VIEW_CACHE.move_to_end(key)
+        while len(_PLAYNITE_VIEW_CACHE) > _PLAYNITE_VIEW_CACHE_SIZE:
+            _PLAYNITE_VIEW_CACHE.popitem(last=False)
+    return view
+
+# Previous Id -> Modified map of the NDJSON refresh a pool worker serves
+_PLAYNITE_NDJSON_PREVIOUS: Dict[str, Any] = {}
+
+
+def _set_ndjson_previous(modified_by_id: Dict[str, Any]) -> None:
+    """Process-pool initializer: receive the previous Id -> Modified map once per worker."""
+    global _PLAYNITE_NDJSON_PREVIOUS
+    _PLAYNITE_NDJSON_PREVIOUS = modified_by_id
+
+
+def _normalize_ndjson_chunk(path: str, start: int, end: int) -> List[Dict[str, Any] | str]:
+    """Process-pool worker: normalize the NDJSON records in bytes [start, end) of a file.
+
+    An entry whose Id and Modified match _PLAYNITE_NDJSON_PREVIOUS is returned as
+    its Id alone, for the parent to reuse the previous record.
+    """
+    previous = _PLAYNITE_NDJSON_PREVIOUS
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    normalized: List[Dict[str, Any] | str] = []
+    for line in raw.decode("utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        g = json.loads(line)
+        if previous and isinstance(g, dict) and g.get("Modified") is not None:
+            gid = str(g.get("Id", ""))
+            if gid in previous and previous[gid] == g.get("Modified"):
+                normalized.append(gid)
                 continue
+        entry = playnite_library._normalize_game(g)
+        if entry is not None:
+            normalized.append(entry)
+    return normalized
 
-            # IDs - Playnite uses GUID strings in Id field
-            gid = g.get("Id", "")
-
-            # Playtime - stored in seconds in Playnite JSON
-            playtime_seconds = g.get("Playtime", 0)
-            playtime_minutes = int(playtime_seconds) // 60
-
-            # Source - object with Name field (e.g., Steam, GOG, itch.io)
-            source_name = None
-            source_obj = g.get("Source")
-            if isinstance(source_obj, dict):
-                source_name = source_obj.get("Name")
-
-            # Completion status - object with Name field
-            completion_status = None
-            completion_obj = g.get("CompletionStatus")
-            if isinstance(completion_obj, dict):
-                completion_status = completion_obj.get("Name")
-
-            # Release year (int)
-            release_year = int(g.get("ReleaseYear", 0) or 0)
-
-            # Scores
-            user_score = int(g.get("UserScore", 0) or 0)
-            critic_score = int(g.get("CriticScore", 0) or 0)
-            community_score = int(g.get("CommunityScore", 0) or 0)
-
-            # Additional attributes commonly present in Playnite exports
-            tags_list = g.get("Tags", [])
-            genres_list = g.get("Genres", [])
-            features_list = g.get("Features", [])
-            platforms_list = g.get("Platforms", [])
-            categories_list = g.get("Categories", [])
-            series_obj = g.get("Series")
-            favorite_flag = bool(g.get("Favorite", False))
-            added_date = g.get("Added")
-            modified_date = g.get("Modified")
-
-            normalized.append({
-                "name": str(name),
-                "id": str(gid),
-                "playtime_minutes": playtime_minutes,
-                "source": str(source_name) if source_name else None,
-                "completion_status": str(completion_status) if completion_status else None,
-                "release_year": release_year,
-                "user_score": user_score,
-                "critic_score": critic_score,
-                "community_score": community_score,
-                # Pass-through attributes for helper-based filtering
-                "Tags": tags_list,
-                "Genres": genres_list,
-                "Features": features_list,
-                "Platforms": platforms_list,
-                "Categories": categories_list,
-                "Series": series_obj,
-                "Favorite": favorite_flag,
-                "Added": added_date,
-                "Modified": modified_date,
-            })
 
-        return normalized
+class _PlayniteJsonStream:
+    """Incremental decoder for the games collection of a Playnite JSON export.
+
+    Reads the text stream in fixed-size chunks and uses JSONDecoder.raw_decode to
+    pull out one game object at a time, so memory scales with a single record
+    rather than with the whole file.
+    """
+
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self, f: TextIO, chunk_size: int = _PLAYNITE_STREAM_CHUNK_CHARS):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, discarding consumed text. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next significant character ('' at EOF)."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more chunks as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _expect(self, ch: str) -> None:
+        found = self._peek()
+        if found != ch:
+            raise ValueError(f"Expected '{ch}' but found '{found or 'EOF'}' while streaming Playnite JSON")
+        self._pos += 1
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            ch = self._peek()
+            if ch == ",":
+                self._pos += 1
+                continue
+            if ch == "]":
+                self._pos += 1
+                return
+            raise ValueError(f"Unexpected '{ch or 'EOF'}' inside Playnite games array")
+
+    def iter_games(self) -> Iterator[Any]:
+        """Yield raw game objects from a list, a wrapper dict, or NDJSON input."""
+        first = self._peek()
+        if first == "[":
+            yield from self._iter_array()
+            return
+        if first != "{":
+            raise RuntimeError("Unsupported Playnite JSON structure.")
+
+        # Walk the top-level object key by key so a wrapped games list is never
+        # materialized; other keys are collected in case this is an NDJSON record.
+        self._pos += 1
+        head: Dict[str, Any] = {}
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                key = self._decode_value()
+                if not isinstance(key, str):
+                    raise ValueError("Expected an object key while streaming Playnite JSON")
+                self._expect(":")
+                if key in _PLAYNITE_GAMES_KEYS and self._peek() == "[":
+                    yield from self._iter_array()
+                    return
+                head[key] = self._decode_value()
+                ch = self._peek()
+                if ch == ",":
+                    self._pos += 1
+                    continue
+                if ch == "}":
+                    self._pos += 1
+                    break
+                raise ValueError(f"Unexpected '{ch or 'EOF'}' inside Playnite JSON object")
+
+        # No games list found: treat as NDJSON (one game object per line)
+        if self._peek() != "{":
+            raise RuntimeError(
+                "Unsupported Playnite JSON format: expected a list or a dict containing a games list."
+            )
+        yield head
+        while self._peek() == "{":
+            yield self._decode_value()
+        if self._peek():
+            raise ValueError("Trailing data after NDJSON records in Playnite export")
 
 
 playnite_library = PlayniteLibraryHolder()
\ No newline at end of file
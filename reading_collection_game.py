@@ -28,6 +28,7 @@ from Options import FreeText, OptionSet, TextChoice, Toggle  # type: ignore
 from ..game import Game  # type: ignore
 from ..game_objective_template import GameObjectiveTemplate  # type: ignore
 from ..enums import KeymastersKeepGamePlatforms  # type: ignore
+from .collection_csv_cache import CSVFolderCache
 
 
 # === Options Dataclass ===
@@ -51,6 +52,8 @@ class _ReadingCollectionHolder:
 
     def __init__(self):
         self._notice_printed = False
+        # Parsed rows persisted next to the CSVs; stale files are parsed in a process pool
+        self._csv_cache = CSVFolderCache("Reading Collection", "READING_COLLECTION")
 
     @functools.lru_cache(maxsize=4)
     def parse_source(self, source: str, base_dir: str = "") -> List[Dict[str, Any]]:
@@ -86,8 +89,8 @@ class _ReadingCollectionHolder:
                     self._notice_printed = True
                 continue
 
-            for csv_file in csv_files:
-                books.extend(self._parse_csv_file(csv_file, src))
+            for file_books in self._csv_cache.parse_files(src_dir, csv_files, functools.partial(_parse_reading_csv_file, csv_format=src)):
+                books.extend(file_books)
 
         # Deduplicate by title+author, preferring entries with more data
         if len(sources_to_load) > 1:
@@ -286,6 +289,11 @@ class _ReadingCollectionHolder:
 _reading_holder = _ReadingCollectionHolder()
 
 
+def _parse_reading_csv_file(path: str, csv_format: str) -> List[Dict[str, Any]]:
+    """Process-pool worker: parse one CSV with this process's holder."""
+    return _reading_holder._parse_csv_file(Path(path), csv_format)
+
+
 # === Main Game Class ===
 class ReadingCollectionGame(Game):
     name = "Reading Collection"
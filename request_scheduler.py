@@ -0,0 +1,150 @@
+"""
+Shared HTTP request scheduler for the API-backed games.
+
+Steam Achievements, Discogs Collection, Wikipedia, Archipelocal and Barkeepelago
+send every request through the single request_scheduler instance defined here,
+so each API host gets one token bucket, one concurrency cap and one pooled
+session no matter how many games or threads call it. Game modules register the
+limits of the hosts they talk to with configure_host() at import time.
+
+This module defines no game; copy it next to any of the game files above.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict, List
+from urllib.parse import urlsplit
+
+# Rate limiting (429) and transient server errors are retried
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Longest wait between attempts, whether from Retry-After or backoff
+_MAX_RETRY_DELAY = 30.0
+
+
+@dataclass(frozen=True)
+class HostLimits:
+    """Token bucket and retry settings for one API host."""
+
+    rate: float = 2.0  # requests per second
+    burst: int = 2
+    max_concurrent: int = 2
+    max_retries: int = 3
+    retry_backoff: float = 1.0  # seconds, doubled per attempt
+
+
+class RequestScheduler:
+    """Pooled HTTP session with a token bucket, a concurrency cap and retries per API host.
+
+    Each host refills rate tokens per second up to burst and allows at most
+    max_concurrent requests in flight; hosts that were never configured use the
+    HostLimits defaults. 429/5xx responses and connection errors are retried with
+    jittered exponential backoff, honouring Retry-After. Timeouts are raised to
+    the caller unless get() is asked to retry them, so callers with their own
+    escalating timeouts stay in control of how long they wait.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._session = None
+        self._limits: Dict[str, HostLimits] = {}
+        self._buckets: Dict[str, List[float]] = {}
+        self._slots: Dict[str, BoundedSemaphore] = {}
+
+    def configure_host(self, host: str, **limits: Any) -> None:
+        """Set the HostLimits for a host, e.g. configure_host("api.example.com", rate=1.0, burst=5)."""
+        with self._lock:
+            self._limits[host] = HostLimits(**limits)
+            self._buckets.pop(host, None)
+            self._slots.pop(host, None)
+
+    def _host_state(self, host: str) -> BoundedSemaphore:
+        with self._lock:
+            if host not in self._slots:
+                limits = self._limits.get(host, HostLimits())
+                self._buckets[host] = [float(limits.burst), time.monotonic()]
+                self._slots[host] = BoundedSemaphore(limits.max_concurrent)
+            return self._slots[host]
+
+    def _take_token(self, host: str, limits: HostLimits) -> None:
+        while True:
+            with self._lock:
+                bucket = self._buckets[host]
+                now = time.monotonic()
+                bucket[0] = min(float(limits.burst), bucket[0] + (now - bucket[1]) * limits.rate)
+                bucket[1] = now
+                if bucket[0] >= 1.0:
+                    bucket[0] -= 1.0
+                    return
+                wait = (1.0 - bucket[0]) / limits.rate
+            time.sleep(wait)
+
+    def _retry_delay(self, resp, attempt: int, limits: HostLimits) -> float:
+        """Seconds to wait before retrying: Retry-After when given, else jittered exponential backoff."""
+        retry_after = resp.headers.get("Retry-After") if resp is not None else None
+        if retry_after:
+            try:
+                return min(_MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after).timestamp()
+                    return min(_MAX_RETRY_DELAY, max(0.0, when - time.time()))
+                except (TypeError, ValueError):
+                    pass
+        return min(_MAX_RETRY_DELAY, limits.retry_backoff * (2 ** attempt) * (1 + random.random() / 2))
+
+    def get(
+        self,
+        url: str,
+        retry_timeouts: bool = False,
+        on_attempt: Callable[[float, Any], None] | None = None,
+        **kwargs,
+    ):
+        """requests.get through the shared session, waiting for the host's rate limit.
+
+        Returns the last response, which may still be a 429/5xx once retries run
+        out. on_attempt(seconds, response or None) is called after every attempt.
+        """
+        import requests
+
+        host = urlsplit(url).netloc
+        slots = self._host_state(host)
+        with self._lock:
+            limits = self._limits.get(host, HostLimits())
+            if self._session is None:
+                self._session = requests.Session()
+            session = self._session
+
+        attempt = 0
+        while True:
+            resp = None
+            error = None
+            with slots:
+                self._take_token(host, limits)
+                started = time.perf_counter()
+                try:
+                    resp = session.get(url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    # ConnectTimeout is also a ConnectionError; only retry it when asked to
+                    if isinstance(e, requests.exceptions.Timeout) and not retry_timeouts:
+                        if on_attempt is not None:
+                            on_attempt(time.perf_counter() - started, None)
+                        raise
+                    error = e
+                if on_attempt is not None:
+                    on_attempt(time.perf_counter() - started, resp)
+            if error is None and resp.status_code not in RETRY_STATUSES:
+                return resp
+            if attempt >= limits.max_retries:
+                if error is not None:
+                    raise error
+                return resp
+            time.sleep(self._retry_delay(resp, attempt, limits))
+            attempt += 1
+
+
+request_scheduler = RequestScheduler()
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import bisect
 import functools
+import hashlib
+import json
 import random
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from os import environ
+from pathlib import Path
+from threading import Lock
 import requests
-from typing import List, Set, Dict
+from typing import Any, Callable, Deque, List, Set, Dict, Tuple
 
 from dataclasses import dataclass
 
@@ -13,6 +23,33 @@ from Options import NamedRange, OptionSet, FreeText, Range, DefaultOnToggle, Tog
 from ..game import Game
 from ..game_objective_template import GameObjectiveTemplate
 from ..enums import KeymastersKeepGamePlatforms
+from .request_scheduler import RETRY_STATUSES, request_scheduler
+
+# Candidate games probed concurrently while searching for an achievement match
+_STEAM_PREFETCH_WINDOW = 8
+# Per-host limits for api.steampowered.com, enforced by the shared request scheduler
+_STEAM_MAX_CONCURRENT_REQUESTS = 4
+_STEAM_MIN_REQUEST_INTERVAL = 0.05  # seconds between request starts
+# Retry policy for transient failures (429, 5xx, connection errors, timeouts) and circuit breaker
+_STEAM_MAX_RETRIES = 3
+_STEAM_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+_STEAM_CIRCUIT_FAILURE_THRESHOLD = 5
+_STEAM_CIRCUIT_COOLDOWN = 60.0
+# Disk cache lifetimes per endpoint: schemas almost never change, global percentages drift slowly
+_STEAM_SCHEMA_TTL = 30 * 86400
+_STEAM_GLOBAL_PERCENTAGES_TTL = 3 * 86400
+_STEAM_ACHIEVEMENT_INDEX_TTL = 86400
+# How long an app that answered "no stats" / no achievements stays pruned from the eligible set
+_STEAM_NO_STATS_TTL = 14 * 86400
+
+request_scheduler.configure_host(
+    "api.steampowered.com",
+    rate=1 / _STEAM_MIN_REQUEST_INTERVAL,
+    burst=1,
+    max_concurrent=_STEAM_MAX_CONCURRENT_REQUESTS,
+    max_retries=_STEAM_MAX_RETRIES,
+    retry_backoff=_STEAM_RETRY_BACKOFF,
+)
 
 @dataclass
 class SteamAchievementsArchipelagoOptions:
@@ -32,6 +69,8 @@ class SteamAchievementsArchipelagoOptions:
     steam_achievements_time_consuming_threshold: SteamAchievementsTimeConsumingThreshold
     steam_achievements_difficulty_threshold: SteamAchievementsDifficultyThreshold
     steam_achievements_include_redo_achievements: SteamAchievementsIncludeRedoAchievements
+    steam_achievements_build_tier_index: SteamAchievementsBuildTierIndex
+    steam_achievements_batch_percentage_scan: SteamAchievementsBatchPercentageScan
 
 class SteamAchievementsGame(Game):
     name = "Steam Achievements"
@@ -42,6 +81,8 @@ class SteamAchievementsGame(Game):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._eligible_games_cache: List[Dict[str, any]] | None = None
+        self._tier_buckets_cache: Dict[Tuple[str, bool], List[Tuple[str, List[str]]]] | None = None
+        self._completion_cache: Tuple[List[float], List[str]] | None = None
 
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
         eligible_games = self._get_eligible_games_data()
@@ -270,6 +311,13 @@ class SteamAchievementsGame(Game):
                 
             filtered_games.append(game)
 
+        without_stats = steam_library.apps_without_stats(steam_id)
+        if without_stats:
+            pruned = [g for g in filtered_games if str(g["appid"]) not in without_stats]
+            if len(pruned) < len(filtered_games):
+                print(f"  Steam Achievements: skipping {len(filtered_games) - len(pruned)} game(s) known to have no achievements")
+            filtered_games = pruned
+
         self._eligible_games_cache = filtered_games
         return filtered_games
 
@@ -288,6 +336,10 @@ class SteamAchievementsGame(Game):
         eligible = self._get_eligible_games_data()
         if not eligible:
             return []
+
+        buckets = self._tier_buckets()
+        if buckets is not None:
+            return self._pick_from_bucket(buckets, tier, redo=False)
         
         shuffled = eligible[:]
         random.shuffle(shuffled)
@@ -297,10 +349,10 @@ class SteamAchievementsGame(Game):
         time_threshold = float(self.archipelago_options.steam_achievements_time_consuming_threshold.value)
         diff_threshold = float(self.archipelago_options.steam_achievements_difficulty_threshold.value)
         
-        for i, game in enumerate(shuffled, 1):
+        def probe(game: Dict[str, any]) -> List[str]:
             achievements = steam_library.get_locked_achievements(steam_id, game["appid"], include_hidden)
             if not achievements:
-                continue
+                return []
             
             global_pcts = steam_library.get_global_achievement_percentages(game["appid"])
             
@@ -314,14 +366,75 @@ class SteamAchievementsGame(Game):
                     filtered.append(f"Unlock the achievement '{achievement}' in {game['name']}")
                 elif tier == "hard" and pct < diff_threshold:
                     filtered.append(f"Unlock the achievement '{achievement}' in {game['name']}")
-            
-            if filtered:
-                print(f"    [{tier}] Found match after checking {i} game(s)")
-                return filtered
+            return filtered
+
+        try:
+            checked, filtered = _first_matching_game(shuffled, probe)
+        except SteamApiUnavailable:
+            print(f"    [{tier}] Steam API unavailable; search stopped")
+            return []
+        steam_stats.record_probe(tier, checked, bool(filtered))
+        if filtered:
+            print(f"    [{tier}] Found match after checking {checked} game(s)")
+            return filtered
         
         print(f"    [{tier}] No match found after checking {len(shuffled)} games")
         return []
 
+    def _tier_buckets(self) -> Dict[Tuple[str, bool], List[Tuple[str, List[str]]]] | None:
+        """Bucket every indexed achievement by (tier, already unlocked) for the current thresholds.
+
+        Returns None unless the tier index option is on and a Steam API key is set.
+        The index itself holds raw percentages, so changing thresholds only re-buckets.
+        """
+        if self._tier_buckets_cache is not None:
+            return self._tier_buckets_cache
+        if not self.archipelago_options.steam_achievements_build_tier_index.value or not _steam_api_key():
+            return None
+
+        steam_id = self.archipelago_options.steam_achievements_steam_id.value
+        include_hidden = self.archipelago_options.steam_achievements_include_hidden_achievements.value
+        time_threshold = float(self.archipelago_options.steam_achievements_time_consuming_threshold.value)
+        diff_threshold = float(self.archipelago_options.steam_achievements_difficulty_threshold.value)
+
+        eligible = self._get_eligible_games_data()
+        index = steam_library.build_achievement_index(steam_id, eligible)
+
+        buckets: Dict[Tuple[str, bool], List[Tuple[str, List[str]]]] = {}
+        for game in eligible:
+            per_game: Dict[Tuple[str, bool], List[str]] = {}
+            for name, pct, achieved, hidden in index.get(str(game["appid"]), []):
+                if hidden and not include_hidden:
+                    continue
+                if achieved and game.get("playtime_forever", 0) <= 0:
+                    continue
+                if pct >= time_threshold:
+                    tier = "quick"
+                elif pct >= diff_threshold:
+                    tier = "medium"
+                else:
+                    tier = "hard"
+                per_game.setdefault((tier, bool(achieved)), []).append(name)
+            for bucket_key, names in per_game.items():
+                buckets.setdefault(bucket_key, []).append((game["name"], names))
+
+        self._tier_buckets_cache = buckets
+        return buckets
+
+    def _pick_from_bucket(
+        self, buckets: Dict[Tuple[str, bool], List[Tuple[str, List[str]]]], tier: str, redo: bool
+    ) -> List[str]:
+        candidates = buckets.get((tier, redo))
+        label = f"{tier} redo" if redo else tier
+        steam_stats.record_probe(label, 0, bool(candidates))
+        if not candidates:
+            print(f"    [{label}] No match in achievement tier index")
+            return []
+        game_name, achievements = random.choice(candidates)
+        print(f"    [{label}] Picked from achievement tier index ({len(candidates)} matching games)")
+        verb = "Re-do" if redo else "Unlock"
+        return [f"{verb} the achievement '{achievement}' in {game_name}" for achievement in achievements]
+
     def quick_specific_achievements_with_games(self) -> List[str]:
         return self._get_achievements_by_tier(tier="quick")
 
@@ -341,6 +454,10 @@ class SteamAchievementsGame(Game):
         if not played:
             return []
 
+        buckets = self._tier_buckets()
+        if buckets is not None:
+            return self._pick_from_bucket(buckets, tier, redo=True)
+
         shuffled = played[:]
         random.shuffle(shuffled)
 
@@ -349,10 +466,10 @@ class SteamAchievementsGame(Game):
         time_threshold = float(self.archipelago_options.steam_achievements_time_consuming_threshold.value)
         diff_threshold = float(self.archipelago_options.steam_achievements_difficulty_threshold.value)
 
-        for i, game in enumerate(shuffled, 1):
+        def probe(game: Dict[str, any]) -> List[str]:
             achievements = steam_library.get_unlocked_achievements(steam_id, game["appid"], include_hidden)
             if not achievements:
-                continue
+                return []
 
             global_pcts = steam_library.get_global_achievement_percentages(game["appid"])
 
@@ -366,10 +483,17 @@ class SteamAchievementsGame(Game):
                     filtered.append(f"Re-do the achievement '{achievement}' in {game['name']}")
                 elif tier == "hard" and pct < diff_threshold:
                     filtered.append(f"Re-do the achievement '{achievement}' in {game['name']}")
+            return filtered
 
-            if filtered:
-                print(f"    [{tier} redo] Found match after checking {i} game(s)")
-                return filtered
+        try:
+            checked, filtered = _first_matching_game(shuffled, probe)
+        except SteamApiUnavailable:
+            print(f"    [{tier} redo] Steam API unavailable; search stopped")
+            return []
+        steam_stats.record_probe(f"{tier} redo", checked, bool(filtered))
+        if filtered:
+            print(f"    [{tier} redo] Found match after checking {checked} game(s)")
+            return filtered
 
         print(f"    [{tier} redo] No match found after checking {len(shuffled)} games")
         return []
@@ -392,8 +516,60 @@ class SteamAchievementsGame(Game):
         max_pct = self.archipelago_options.steam_achievements_percentage_max.value
         return range(min(min_pct, max_pct), max(min_pct, max_pct) + 1)
 
+    def _completion_percentages(self) -> Tuple[List[float], List[str]] | None:
+        """Completion percentage of every played game, sorted ascending, with matching game names.
+
+        Read from the achievement tier index when that option is on, otherwise fetched
+        for all played games at once when the batch percentage scan option is on.
+        Returns None when neither option is enabled.
+        """
+        if self._completion_cache is not None:
+            return self._completion_cache
+
+        use_index = self.archipelago_options.steam_achievements_build_tier_index.value and _steam_api_key()
+        if not use_index and not self.archipelago_options.steam_achievements_batch_percentage_scan.value:
+            return None
+
+        steam_id = self.archipelago_options.steam_achievements_steam_id.value
+        played = [g for g in self._get_eligible_games_data() if g.get("playtime_forever", 0) > 0]
+
+        if use_index:
+            index = steam_library.build_achievement_index(steam_id, played)
+            counts = []
+            for game in played:
+                rows = index.get(str(game["appid"]))
+                counts.append(None if rows is None else (sum(1 for row in rows if row[2]), len(rows)))
+        else:
+            print(f"  Steam Achievements: scanning completion of {len(played)} played game(s)...")
+
+            def scan(game: Dict[str, any]) -> Tuple[int, int] | None:
+                try:
+                    return steam_library.get_achievement_counts(steam_id, game["appid"])
+                except SteamApiUnavailable:
+                    raise
+                except SteamApiError:
+                    return None
+
+            with ThreadPoolExecutor(max_workers=_STEAM_PREFETCH_WINDOW) as pool:
+                counts = list(pool.map(scan, played))
+            steam_stats.record_probe("percentage scan", len(played), any(c and c[1] for c in counts))
+
+        completion = []
+        for game, game_counts in zip(played, counts):
+            if game_counts is None or game_counts[1] == 0:
+                continue
+            unlocked, total = game_counts
+            completion.append(((unlocked / total) * 100, game["name"]))
+        completion.sort()
+        self._completion_cache = ([pct for pct, _ in completion], [name for _, name in completion])
+        return self._completion_cache
+
     def percentage_objectives(self) -> List[str]:
-        """Pick a random game, check its progress with one API call, return valid percentages above current."""
+        """Pick a random game below percentage_max and return valid percentages above its current completion.
+
+        With a batched completion scan this is a bisect over sorted percentages;
+        otherwise random played games are checked one API call at a time.
+        """
         eligible = self._get_eligible_games_data()
         if not eligible:
             return []
@@ -406,11 +582,39 @@ class SteamAchievementsGame(Game):
         if not played:
             return []
 
+        try:
+            completion = self._completion_percentages()
+        except SteamApiUnavailable:
+            print("    [percentage] Steam API unavailable; completion scan stopped")
+            return []
+        if completion is not None:
+            pcts, names = completion
+            # int(pct) + 1 <= max_pct exactly when pct < max_pct
+            below = bisect.bisect_left(pcts, max_pct)
+            steam_stats.record_probe("percentage", 0, bool(below))
+            if not below:
+                print(f"    [percentage] No game below {max_pct}% completion")
+                return []
+            i = random.randrange(below)
+            effective_min = max(min_pct, int(pcts[i]) + 1)
+            print(f"    [percentage] Picked from {below} game(s) below {max_pct}% completion")
+            return [
+                f"Unlock at least {pct}% of the achievements in {names[i]}"
+                for pct in range(effective_min, max_pct + 1)
+            ]
+
         shuffled = played[:]
         random.shuffle(shuffled)
 
         for i, game in enumerate(shuffled, 1):
-            counts = steam_library.get_achievement_counts(steam_id, game["appid"])
+            try:
+                counts = steam_library.get_achievement_counts(steam_id, game["appid"])
+            except SteamApiUnavailable:
+                steam_stats.record_probe("percentage", i, False)
+                print(f"    [percentage] Steam API unavailable; search stopped after {i} game(s)")
+                return []
+            except SteamApiError:
+                continue
             if counts is None:
                 continue
             unlocked, total = counts
@@ -420,15 +624,59 @@ class SteamAchievementsGame(Game):
             effective_min = max(min_pct, int(current_pct) + 1)
             if effective_min > max_pct:
                 continue
+            steam_stats.record_probe("percentage", i, True)
             print(f"    [percentage] Found match after checking {i} game(s)")
             return [
                 f"Unlock at least {pct}% of the achievements in {game['name']}"
                 for pct in range(effective_min, max_pct + 1)
             ]
 
+        steam_stats.record_probe("percentage", len(shuffled), False)
         print(f"    [percentage] No match found after checking {len(shuffled)} games")
         return []
 
+def _first_matching_game(
+    games: List[Dict[str, any]], probe: Callable[[Dict[str, any]], List[str]]
+) -> Tuple[int, List[str]]:
+    """Probe games in order with a sliding window of concurrent lookups.
+
+    Up to _STEAM_PREFETCH_WINDOW probes run ahead of the game being examined, so
+    network round-trips overlap while the first match in list order still wins.
+    Returns (games checked, probe result), or (len(games), []) when nothing matches.
+    A probe that fails counts as no match, except SteamApiUnavailable: the breaker
+    is open, so the search stops and the exception propagates.
+    """
+    pending: Deque[Tuple[int, Future]] = deque()
+    candidates = iter(enumerate(games, 1))
+
+    with ThreadPoolExecutor(max_workers=_STEAM_PREFETCH_WINDOW) as pool:
+        def fill() -> None:
+            while len(pending) < _STEAM_PREFETCH_WINDOW:
+                try:
+                    i, game = next(candidates)
+                except StopIteration:
+                    return
+                pending.append((i, pool.submit(probe, game)))
+
+        fill()
+        while pending:
+            i, future = pending.popleft()
+            try:
+                result = future.result()
+            except SteamApiUnavailable:
+                for _, other in pending:
+                    other.cancel()
+                raise
+            except Exception:
+                result = []
+            if result:
+                for _, other in pending:
+                    other.cancel()
+                return i, result
+            fill()
+
+    return len(games), []
+
 # Define options specifically for this game to avoid confusion in YAML
 class SteamAchievementsMinTimePlayed(NamedRange):
     """
@@ -537,6 +785,23 @@ class SteamAchievementsIncludeRedoAchievements(Toggle):
     """
     display_name = "Steam Achievements Include Redo Achievements"
 
+class SteamAchievementsBuildTierIndex(Toggle):
+    """
+    Fetch achievements and global unlock percentages for every eligible game once, and pick specific and
+    redo achievement objectives from that index instead of probing random games.
+    Each game's entry is saved between runs and refetched once it is a day old; the first build can take a while
+    on large libraries.
+    """
+    display_name = "Steam Achievements Build Tier Index"
+
+class SteamAchievementsBatchPercentageScan(Toggle):
+    """
+    Check achievement progress for every played game at once and pick percentage objectives from the games
+    below the maximum percentage, instead of checking random games one at a time.
+    Always on when Build Tier Index is enabled, since the index already holds every game's progress.
+    """
+    display_name = "Steam Achievements Batch Percentage Scan"
+
 class SteamAchievementsTimeConsumingThreshold(Range):
     """
     Global unlock percentage threshold for time-consuming achievements.
@@ -560,43 +825,377 @@ class SteamAchievementsDifficultyThreshold(Range):
     range_start = 1
     range_end = 100
 
+class SteamApiStats:
+    """Counters and timers for one generation run, dumpable as JSON.
+
+    Tracks Steam Web API calls per endpoint (count, bytes, status codes, latency
+    percentiles), cache hits and misses per cache layer, and how many games each
+    tier search probed. Set STEAM_ACHIEVEMENTS_STATS_FILE to write the snapshot
+    there when the process exits.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._latencies: Dict[str, List[float]] = {}
+        self._bytes: Dict[str, int] = {}
+        self._statuses: Dict[str, Dict[str, int]] = {}
+        self._cache: Dict[str, List[int]] = {}
+        self._probes: Dict[str, List[Tuple[int, bool]]] = {}
+
+    def record_call(self, endpoint: str, seconds: float, size: int, status: int | None) -> None:
+        with self._lock:
+            self._latencies.setdefault(endpoint, []).append(seconds)
+            self._bytes[endpoint] = self._bytes.get(endpoint, 0) + size
+            statuses = self._statuses.setdefault(endpoint, {})
+            label = str(status) if status is not None else "error"
+            statuses[label] = statuses.get(label, 0) + 1
+
+    def record_cache(self, layer: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._cache.setdefault(layer, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def record_probe(self, tier: str, checked: int, matched: bool) -> None:
+        """Record one search: games whose achievements it had to check (0 for index picks) and whether it matched."""
+        with self._lock:
+            self._probes.setdefault(tier, []).append((checked, matched))
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {}
+            for endpoint, latencies in self._latencies.items():
+                ordered = sorted(latencies)
+                endpoints[endpoint] = {
+                    "calls": len(ordered),
+                    "bytes": self._bytes.get(endpoint, 0),
+                    "statuses": dict(self._statuses.get(endpoint, {})),
+                    "total_seconds": round(sum(ordered), 4),
+                    "p50_seconds": round(self._percentile(ordered, 0.5), 4),
+                    "p95_seconds": round(self._percentile(ordered, 0.95), 4),
+                }
+            cache = {layer: {"hits": hits, "misses": misses} for layer, (hits, misses) in self._cache.items()}
+            probes = {}
+            for tier, searches in self._probes.items():
+                probes[tier] = {
+                    "searches": len(searches),
+                    "matched": sum(1 for _, matched in searches if matched),
+                    "games_probed": sum(checked for checked, _ in searches),
+                    "max_games_probed": max(checked for checked, _ in searches),
+                }
+        player = steam_library.get_player_achievements.cache_info()
+        cache["player_achievements_memory"] = {"hits": player.hits, "misses": player.misses}
+        return {"endpoints": endpoints, "cache": cache, "probes_by_tier": probes}
+
+    def dump(self, path: str) -> None:
+        """Write the current snapshot to path as JSON."""
+        try:
+            Path(path).expanduser().write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+            print(f"[Steam] Wrote API statistics to {path}")
+        except OSError as e:
+            print(f"[Steam] Could not write API statistics to {path}: {e}")
+
+
+def _dump_steam_stats_at_exit() -> None:
+    path = (environ.get("STEAM_ACHIEVEMENTS_STATS_FILE") or "").strip()
+    if path:
+        steam_stats.dump(path)
+
+
+class SteamDiskCache:
+    """SQLite-backed cache of Steam Web API results that survives between runs.
+
+    Rows are keyed by (endpoint, key) and carry their fetch time; each read passes
+    the endpoint's TTL so stable data (schemas) and drifting data (global
+    percentages) expire independently. Set STEAM_ACHIEVEMENTS_CACHE=0 to disable,
+    or STEAM_ACHIEVEMENTS_CACHE_DIR to move the database. The cache is bypassed
+    in STEAM_FIXTURE_MODE record and replay.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._unavailable = False
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if _steam_fixture_mode():
+            # Record must see every request and replay must serve only fixtures
+            return None
+        if self._conn is not None or self._unavailable:
+            return self._conn
+        if (environ.get("STEAM_ACHIEVEMENTS_CACHE") or "").strip().lower() in ("0", "false", "no", "off"):
+            self._unavailable = True
+            return None
+        cache_dir = (environ.get("STEAM_ACHIEVEMENTS_CACHE_DIR") or "").strip()
+        path = Path(cache_dir).expanduser() if cache_dir else Path.home() / ".cache" / "keymasters_keep" / "steam"
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path / "steam_cache.sqlite3"), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "endpoint TEXT NOT NULL, key TEXT NOT NULL, fetched_at REAL NOT NULL, payload TEXT NOT NULL, "
+                "PRIMARY KEY (endpoint, key))"
+            )
+            conn.commit()
+        except Exception as e:
+            print(f"[Steam] Disk cache unavailable ({type(e).__name__}: {e}); continuing without it")
+            self._unavailable = True
+            return None
+        self._conn = conn
+        return conn
+
+    def get(self, endpoint: str, key: str, ttl: float) -> Any:
+        """Return the cached payload if it is younger than ttl seconds, else None."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT fetched_at, payload FROM responses WHERE endpoint = ? AND key = ?", (endpoint, key)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None or time.time() - row[0] > ttl:
+            steam_stats.record_cache(f"disk:{endpoint}", False)
+            return None
+        try:
+            payload = json.loads(row[1])
+        except ValueError:
+            steam_stats.record_cache(f"disk:{endpoint}", False)
+            return None
+        steam_stats.record_cache(f"disk:{endpoint}", True)
+        return payload
+
+    def scan(self, endpoint: str, prefix: str, ttl: float) -> Dict[str, Any]:
+        """Payloads younger than ttl seconds for every key starting with prefix, keyed by the rest of the key."""
+        # Keys in [prefix, prefix with its last character bumped) are exactly the ones starting with prefix
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            try:
+                rows = conn.execute(
+                    "SELECT key, payload FROM responses WHERE endpoint = ? AND key >= ? AND key < ? AND fetched_at >= ?",
+                    (endpoint, prefix, upper, time.time() - ttl),
+                ).fetchall()
+            except sqlite3.Error:
+                return {}
+        payloads = {}
+        for key, payload in rows:
+            try:
+                payloads[key[len(prefix):]] = json.loads(payload)
+            except ValueError:
+                continue
+        return payloads
+
+    def put(self, endpoint: str, key: str, payload: Any) -> None:
+        self.put_many(endpoint, {key: payload})
+
+    def put_many(self, endpoint: str, payloads: Dict[str, Any]) -> None:
+        """Store several rows of one endpoint in a single transaction."""
+        if not payloads:
+            return
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            now = time.time()
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO responses (endpoint, key, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                    [(endpoint, key, now, json.dumps(payload)) for key, payload in payloads.items()],
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+def _steam_endpoint(url: str) -> str:
+    """Method name of a Steam Web API URL, e.g. GetPlayerAchievements."""
+    return url.rstrip("/").split("/")[-2]
+
+
+def _steam_fixture_mode() -> str:
+    """"record", "replay" or "" from STEAM_FIXTURE_MODE."""
+    mode = (environ.get("STEAM_FIXTURE_MODE") or "").strip().lower()
+    return mode if mode in ("record", "replay") else ""
+
+
+def _steam_api_key() -> str | None:
+    """The Steam Web API key; replay mode needs none, so a placeholder stands in."""
+    key = environ.get("STEAM_API_KEY")
+    if not key and _steam_fixture_mode() == "replay":
+        return "replay"
+    return key
+
+
+def _fixture_path(url: str, params: Dict[str, Any]) -> Path:
+    """Fixture file for a request: <dir>/<endpoint>/<hash of params without the key>.json."""
+    fixture_dir = (environ.get("STEAM_FIXTURE_DIR") or "").strip()
+    root = Path(fixture_dir).expanduser() if fixture_dir else Path.home() / ".cache" / "keymasters_keep" / "steam_fixtures"
+    endpoint = _steam_endpoint(url)
+    identity = json.dumps({k: str(v) for k, v in sorted(params.items()) if k != "key"}, sort_keys=True)
+    return root / endpoint / (hashlib.sha1(identity.encode("utf-8")).hexdigest()[:20] + ".json")
+
+
+class _FixtureResponse:
+    """Minimal stand-in for requests.Response served from a recorded fixture."""
+
+    def __init__(self, status_code: int, body: Any):
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {}
+        self._body = body
+
+    def json(self) -> Any:
+        return self._body
+
+
+def _record_fixture(url: str, params: Dict[str, Any], resp: requests.Response) -> None:
+    """Save a live response so it can be replayed later; unparseable bodies are skipped."""
+    try:
+        body = resp.json()
+    except ValueError:
+        return
+    path = _fixture_path(url, params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        safe_params = {k: str(v) for k, v in params.items() if k != "key"}
+        path.write_text(json.dumps({"params": safe_params, "status": resp.status_code, "body": body}), encoding="utf-8")
+    except OSError as e:
+        print(f"[Steam] Could not record fixture {path}: {e}")
+
+
+def _replay_fixture(url: str, params: Dict[str, Any]) -> _FixtureResponse:
+    """Serve a recorded response; requests that were never recorded answer 404."""
+    path = _fixture_path(url, params)
+    try:
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _FixtureResponse(404, {})
+    return _FixtureResponse(int(recorded.get("status", 200)), recorded.get("body"))
+
+
+class SteamApiError(RuntimeError):
+    """A Steam Web API call failed transiently (network error, 429/5xx); nothing is cached for it."""
+
+
+class SteamApiUnavailable(SteamApiError):
+    """Raised instead of calling the Steam Web API while the circuit breaker is open."""
+
+
 class SteamLibraryHolder:
     def __init__(self):
         self._schema_cache: Dict[int, List[Dict]] = {}
+        # Circuit breaker state
+        self._breaker_lock = Lock()
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        # Achievement tier indexes per Steam ID
+        self._achievement_indexes: Dict[str, Dict[str, List[List[any]]]] = {}
+        self._index_lock = Lock()
+        # Appids per Steam ID known to have no achievements or unreadable stats, with the time they were seen
+        self._no_stats: Dict[str, Dict[str, float]] = {}
+        self._no_stats_lock = Lock()
+
+    def _record_outcome(self, ok: bool) -> None:
+        with self._breaker_lock:
+            if ok:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= _STEAM_CIRCUIT_FAILURE_THRESHOLD:
+                if self._circuit_open_until <= time.monotonic():
+                    print(
+                        f"[Steam] {self._consecutive_failures} consecutive API failures; "
+                        f"pausing requests for {_STEAM_CIRCUIT_COOLDOWN:.0f}s"
+                    )
+                self._circuit_open_until = time.monotonic() + _STEAM_CIRCUIT_COOLDOWN
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared request scheduler, behind Steam's circuit breaker.
+
+        The scheduler keeps at most _STEAM_MAX_CONCURRENT_REQUESTS requests in flight
+        with starts _STEAM_MIN_REQUEST_INTERVAL apart, and retries 429/5xx responses,
+        connection errors and timeouts up to _STEAM_MAX_RETRIES times, honouring
+        Retry-After. After _STEAM_CIRCUIT_FAILURE_THRESHOLD consecutive failures,
+        calls raise SteamApiUnavailable for _STEAM_CIRCUIT_COOLDOWN seconds.
+        """
+        fixture_mode = _steam_fixture_mode()
+        if fixture_mode == "replay":
+            return _replay_fixture(url, kwargs.get("params") or {})
+        if self._circuit_open_until > time.monotonic():
+            raise SteamApiUnavailable("Steam Web API circuit breaker is open")
+
+        endpoint = _steam_endpoint(url)
+
+        def record_attempt(seconds: float, resp: requests.Response | None) -> None:
+            steam_stats.record_call(
+                endpoint,
+                seconds,
+                len(resp.content) if resp is not None else 0,
+                resp.status_code if resp is not None else None,
+            )
+
+        try:
+            resp = request_scheduler.get(url, retry_timeouts=True, on_attempt=record_attempt, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            self._record_outcome(False)
+            raise
+        if resp.status_code in RETRY_STATUSES:
+            self._record_outcome(False)
+            return resp
+        self._record_outcome(True)
+        if fixture_mode == "record":
+            _record_fixture(url, kwargs.get("params") or {}, resp)
+        return resp
 
     def _get_schema(self, app_id: int) -> List[Dict]:
         """Fetch and cache the achievement schema for a game."""
         if app_id in self._schema_cache:
+            steam_stats.record_cache("schema_memory", True)
             return self._schema_cache[app_id]
-        key = environ.get("STEAM_API_KEY")
+        steam_stats.record_cache("schema_memory", False)
+        key = _steam_api_key()
         if not key:
             self._schema_cache[app_id] = []
             return []
+        cached = steam_disk_cache.get("schema", str(app_id), _STEAM_SCHEMA_TTL)
+        if cached is not None:
+            self._schema_cache[app_id] = cached
+            return cached
         try:
-            resp = requests.get(
+            resp = self._get(
                 "https://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2/",
                 params={"key": key, "appid": app_id},
                 timeout=10,
             )
+            if resp.status_code in RETRY_STATUSES:
+                # Transient; fall back to api names for now and ask again next time
+                return []
             if resp.status_code == 200:
                 result = resp.json().get("game", {}).get("availableGameStats", {}).get("achievements", [])
+                steam_disk_cache.put("schema", str(app_id), result)
             else:
                 result = []
         except Exception:
-            result = []
+            return []
         self._schema_cache[app_id] = result
         return result
 
     @functools.lru_cache(maxsize=None)
     def games(self, steam_id) -> List[Dict[str, any]]:
-        key = environ.get("STEAM_API_KEY")
+        key = _steam_api_key()
         if not key:
             # Fall back to a small, static set of well-known games
             # Ensures CI tests have valid entries without requiring a Steam API key
             return self._default_games()
         try:
             print("Fetching games from Steam library...")
-            steam_response = requests.get(
+            steam_response = self._get(
                 "https://api.steampowered.com/IPlayerService/GetOwnedGames/v1/",
                 params={
                     "key": key,
@@ -615,107 +1214,151 @@ class SteamLibraryHolder:
             # Any network or parse issue → fallback
             return self._default_games()
 
-    def get_locked_achievements(self, steam_id, app_id, include_hidden=True) -> List[str]:
-        key = environ.get("STEAM_API_KEY")
+    @functools.lru_cache(maxsize=None)
+    def get_player_achievements(self, steam_id, app_id) -> List[Dict[str, any]] | None:
+        """One GetPlayerAchievements call per (steam_id, app_id), shared by the locked,
+        unlocked and count views. Returns the raw achievement entries, or None when
+        Steam definitively has none for this player (no stats, private profile).
+
+        Transient failures raise SteamApiError, so lru_cache keeps no entry for them
+        and the next lookup asks Steam again.
+        """
+        key = _steam_api_key()
         if not key:
-            # Provide placeholder achievement names respecting the hidden toggle
-            return self._default_achievements(include_hidden=include_hidden)
-        
-        # 1. Get Player Achievements
+            return None
         try:
-            resp = requests.get(
+            resp = self._get(
                 "https://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v1/",
                 params={"key": key, "steamid": steam_id, "appid": app_id},
                 timeout=10,
             )
-            if resp.status_code != 200:
-                return []
+        except requests.RequestException as e:
+            raise SteamApiError(f"GetPlayerAchievements failed for app {app_id}: {e}") from e
+        if resp.status_code == 400:
+            # "Requested app has no stats"; a private profile (403) affects every app, so it is not cached
+            self._mark_no_stats(steam_id, app_id)
+            return None
+        if resp.status_code in RETRY_STATUSES:
+            raise SteamApiError(f"GetPlayerAchievements returned HTTP {resp.status_code} for app {app_id}")
+        if resp.status_code != 200:
+            return None
+        try:
             data = resp.json()
-        except Exception:
-            return []
+        except ValueError as e:
+            raise SteamApiError(f"GetPlayerAchievements returned an unreadable body for app {app_id}") from e
 
         if not data.get("playerstats", {}).get("success"):
-            return []
-            
-        achievements = data["playerstats"].get("achievements", [])
-        locked_apinames = [a["apiname"] for a in achievements if a["achieved"] == 0]
-        
-        if not locked_apinames:
-            return []
+            self._mark_no_stats(steam_id, app_id)
+            return None
 
-        # 2. Get Schema for Display Names
+        achievements = data["playerstats"].get("achievements", [])
+        if not achievements:
+            self._mark_no_stats(steam_id, app_id)
+        return achievements
+
+    def _load_no_stats(self, steam_id) -> Dict[str, float]:
+        """The negative cache for a Steam ID, loaded from disk on first use; caller holds _no_stats_lock."""
+        entries = self._no_stats.get(str(steam_id))
+        if entries is None:
+            entries = steam_disk_cache.scan("no_stats", f"{steam_id}:", _STEAM_NO_STATS_TTL)
+            self._no_stats[str(steam_id)] = entries
+        return entries
+
+    def _mark_no_stats(self, steam_id, app_id) -> None:
+        """Remember an app without stats; each app is its own row, so a mark writes one small row."""
+        seen = time.time()
+        with self._no_stats_lock:
+            self._load_no_stats(steam_id)[str(app_id)] = seen
+        steam_disk_cache.put("no_stats", f"{steam_id}:{app_id}", seen)
+
+    def apps_without_stats(self, steam_id) -> Set[str]:
+        """Appids (as strings) that recently had no achievements or private stats for this player."""
+        with self._no_stats_lock:
+            return set(self._load_no_stats(steam_id))
+
+    def _display_names(self, app_id, apinames: List[str], include_hidden: bool) -> List[str]:
+        """Map api names to schema display names, dropping hidden ones unless requested."""
         available_stats = self._get_schema(app_id)
         if not available_stats:
-            return locked_apinames
-        
+            return apinames
+
         name_map = {}
         for a in available_stats:
             if not include_hidden and a.get("hidden", 0) == 1:
                 continue
             name_map[a["name"]] = a.get("displayName") or a.get("name")
-        
-        return [name_map.get(api, api) for api in locked_apinames if include_hidden or api in name_map]
 
-    def get_unlocked_achievements(self, steam_id, app_id, include_hidden=True) -> List[str]:
-        key = environ.get("STEAM_API_KEY")
+        return [name_map.get(api, api) for api in apinames if include_hidden or api in name_map]
+
+    def get_locked_achievements(self, steam_id, app_id, include_hidden=True) -> List[str]:
+        key = _steam_api_key()
         if not key:
+            # Provide placeholder achievement names respecting the hidden toggle
             return self._default_achievements(include_hidden=include_hidden)
 
-        try:
-            resp = requests.get(
-                "https://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v1/",
-                params={"key": key, "steamid": steam_id, "appid": app_id},
-                timeout=10,
-            )
-            if resp.status_code != 200:
-                return []
-            data = resp.json()
-        except Exception:
+        achievements = self.get_player_achievements(steam_id, app_id)
+        if not achievements:
             return []
 
-        if not data.get("playerstats", {}).get("success"):
+        locked_apinames = [a["apiname"] for a in achievements if a["achieved"] == 0]
+        if not locked_apinames:
             return []
 
-        achievements = data["playerstats"].get("achievements", [])
-        unlocked_apinames = [a["apiname"] for a in achievements if a["achieved"] == 1]
+        return self._display_names(app_id, locked_apinames, include_hidden)
 
-        if not unlocked_apinames:
-            return []
+    def get_unlocked_achievements(self, steam_id, app_id, include_hidden=True) -> List[str]:
+        key = _steam_api_key()
+        if not key:
+            return self._default_achievements(include_hidden=include_hidden)
 
-        available_stats = self._get_schema(app_id)
-        if not available_stats:
-            return unlocked_apinames
+        achievements = self.get_player_achievements(steam_id, app_id)
+        if not achievements:
+            return []
 
-        name_map = {}
-        for a in available_stats:
-            if not include_hidden and a.get("hidden", 0) == 1:
-                continue
-            name_map[a["name"]] = a.get("displayName") or a.get("name")
+        unlocked_apinames = [a["apiname"] for a in achievements if a["achieved"] == 1]
+        if not unlocked_apinames:
+            return []
 
-        return [name_map.get(api, api) for api in unlocked_apinames if include_hidden or api in name_map]
+        return self._display_names(app_id, unlocked_apinames, include_hidden)
 
     @functools.lru_cache(maxsize=None)
     def get_global_achievement_percentages(self, app_id) -> Dict[str, float]:
-        """Returns a dict mapping achievement display name to global unlock percentage."""
-        key = environ.get("STEAM_API_KEY")
+        """Returns a dict mapping achievement display name to global unlock percentage.
+
+        Apps Steam has no percentages for map to {}; transient failures raise
+        SteamApiError instead of being cached as empty.
+        """
+        key = _steam_api_key()
         if not key:
             return self._default_global_percentages()
-        try:
-            resp = requests.get(
-                "https://api.steampowered.com/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v2/",
-                params={"gameid": app_id},
-                timeout=10,
-            )
+        pct_by_api = steam_disk_cache.get("global_percentages", str(app_id), _STEAM_GLOBAL_PERCENTAGES_TTL)
+        if pct_by_api is None:
+            try:
+                resp = self._get(
+                    "https://api.steampowered.com/ISteamUserStats/GetGlobalAchievementPercentagesForApp/v2/",
+                    params={"gameid": app_id},
+                    timeout=10,
+                )
+            except requests.RequestException as e:
+                raise SteamApiError(f"GetGlobalAchievementPercentagesForApp failed for app {app_id}: {e}") from e
+            if resp.status_code in RETRY_STATUSES:
+                raise SteamApiError(
+                    f"GetGlobalAchievementPercentagesForApp returned HTTP {resp.status_code} for app {app_id}"
+                )
             if resp.status_code != 200:
                 return {}
-            data = resp.json()
-        except Exception:
-            return {}
-
-        achievements = data.get("achievementpercentages", {}).get("achievements", [])
-        
-        # This endpoint returns api names; map to display names using schema
-        pct_by_api = {a["name"]: float(a["percent"]) for a in achievements}
+            try:
+                data = resp.json()
+            except ValueError as e:
+                raise SteamApiError(
+                    f"GetGlobalAchievementPercentagesForApp returned an unreadable body for app {app_id}"
+                ) from e
+
+            achievements = data.get("achievementpercentages", {}).get("achievements", [])
+
+            # This endpoint returns api names; map to display names using schema
+            pct_by_api = {a["name"]: float(a["percent"]) for a in achievements}
+            steam_disk_cache.put("global_percentages", str(app_id), pct_by_api)
         
         # Try to get display names from cached schema
         available = self._get_schema(app_id)
@@ -735,32 +1378,90 @@ class SteamLibraryHolder:
             "Example Hidden Achievement": 5.0,
         }
 
-    @functools.lru_cache(maxsize=None)
     def get_achievement_counts(self, steam_id, app_id):
-        """Returns (unlocked_count, total_count) for a player's achievements in a game, or None on failure."""
-        key = environ.get("STEAM_API_KEY")
+        """Returns (unlocked_count, total_count) for a player's achievements in a game, or None if
+        Steam has none for them. Transient failures raise SteamApiError."""
+        key = _steam_api_key()
         if not key:
             return (0, 2)
-        try:
-            resp = requests.get(
-                "https://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v1/",
-                params={"key": key, "steamid": steam_id, "appid": app_id},
-                timeout=10,
-            )
-            if resp.status_code != 200:
-                return None
-            data = resp.json()
-        except Exception:
-            return None
 
-        if not data.get("playerstats", {}).get("success"):
+        achievements = self.get_player_achievements(steam_id, app_id)
+        if achievements is None:
             return None
 
-        achievements = data["playerstats"].get("achievements", [])
         total = len(achievements)
         unlocked = sum(1 for a in achievements if a["achieved"] == 1)
         return (unlocked, total)
 
+    def get_achievement_rows(self, steam_id, app_id) -> List[List[any]] | None:
+        """All of a player's achievements in a game as [display name, global %, achieved, hidden] rows.
+
+        Returns None when Steam has no achievements for the player in this game;
+        transient failures raise SteamApiError.
+        """
+        achievements = self.get_player_achievements(steam_id, app_id)
+        if achievements is None:
+            return None
+        schema = {a["name"]: a for a in self._get_schema(app_id)}
+        global_pcts = self.get_global_achievement_percentages(app_id)
+        rows = []
+        for a in achievements:
+            entry = schema.get(a["apiname"], {})
+            display = entry.get("displayName") or entry.get("name") or a["apiname"]
+            rows.append([
+                display,
+                float(global_pcts.get(display, 50.0)),  # Default to 50% if unknown
+                a["achieved"] == 1,
+                entry.get("hidden", 0) == 1,
+            ])
+        return rows
+
+    def build_achievement_index(self, steam_id, games: List[Dict[str, any]]) -> Dict[str, List[List[any]]]:
+        """Per-app achievement rows for every given game, persisted as one row per (Steam ID, app).
+
+        Each app's saved rows carry their own fetch time and are reused until they
+        are older than _STEAM_ACHIEVEMENT_INDEX_TTL; only missing or expired apps are
+        fetched, concurrently. Apps whose fetch failed are left out so the next
+        build retries them, without refreshing anyone else's timestamp.
+        """
+        with self._index_lock:
+            index = self._achievement_indexes.get(str(steam_id))
+            if index is None:
+                index = steam_disk_cache.scan("achievement_rows", f"{steam_id}:", _STEAM_ACHIEVEMENT_INDEX_TTL)
+                self._achievement_indexes[str(steam_id)] = index
+                for game in games:
+                    steam_stats.record_cache("disk:achievement_rows", str(game["appid"]) in index)
+
+            missing = [g["appid"] for g in games if str(g["appid"]) not in index]
+            if missing:
+                print(f"  Steam Achievements: building tier index for {len(missing)} game(s)...")
+
+                unavailable = []
+
+                def fetch(app_id) -> List[List[any]] | None:
+                    try:
+                        return self.get_achievement_rows(steam_id, app_id)
+                    except SteamApiUnavailable:
+                        unavailable.append(app_id)
+                        return None
+                    except SteamApiError:
+                        return None
+
+                fetched: Dict[str, List[List[any]]] = {}
+                with ThreadPoolExecutor(max_workers=_STEAM_PREFETCH_WINDOW) as pool:
+                    rows = pool.map(fetch, missing)
+                    for app_id, app_rows in zip(missing, rows):
+                        if app_rows is not None:
+                            index[str(app_id)] = app_rows
+                            fetched[f"{steam_id}:{app_id}"] = app_rows
+                if unavailable:
+                    print(
+                        f"  Steam Achievements: Steam API unavailable; {len(unavailable)} game(s) left out "
+                        "of the tier index until the next build"
+                    )
+                steam_disk_cache.put_many("achievement_rows", fetched)
+            return index
+
     def _default_games(self) -> List[Dict[str, any]]:
         # Minimal fields used by filtering and formatting: name, appid, playtime_forever, has_community_visible_stats
         return [
@@ -773,4 +1474,7 @@ class SteamLibraryHolder:
         hidden = ["Example Hidden Achievement"]
         return base + (hidden if include_hidden else [])
 
+steam_stats = SteamApiStats()
+steam_disk_cache = SteamDiskCache()
 steam_library = SteamLibraryHolder()
+atexit.register(_dump_steam_stats_at_exit)
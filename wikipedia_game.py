@@ -12,6 +12,7 @@ from ..game import Game
 from ..game_objective_template import GameObjectiveTemplate
 
 from ..enums import KeymastersKeepGamePlatforms
+from .request_scheduler import request_scheduler
 
 
 # Module-level cache that persists across class reloads
@@ -38,6 +39,10 @@ _WIKIPEDIA_PACKS_INIT_LOCK = Lock()  # Thread-safe lock for initialization
 _WIKIPEDIA_MASTER_ARTICLES_CACHE = {}  # Maps pack_dir -> articles list
 _WIKIPEDIA_MASTER_ARTICLES_LOCK = Lock()  # Thread-safe lock
 
+# Wikimedia asks API clients to keep request rates modest and serial-ish
+request_scheduler.configure_host("en.wikipedia.org", rate=5.0, burst=5, max_concurrent=2)
+request_scheduler.configure_host("wikimedia.org", rate=5.0, burst=5, max_concurrent=2)
+
 
 @dataclass
 class WikipediaGameArchipelagoOptions:
@@ -536,7 +541,7 @@ class WikipediaGame(Game):
                 "User-Agent": "KeymastersKeep/1.0 (Wikipedia Game objectives)"
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = request_scheduler.get(url, params=params, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -642,7 +647,7 @@ class WikipediaGame(Game):
                 if cmcontinue:
                     params["cmcontinue"] = cmcontinue
 
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = request_scheduler.get(url, params=params, headers=headers, timeout=10)
 
                 if response.status_code != 200:
                     print(f"[Wikipedia Game] API returned status code {response.status_code}")
@@ -776,7 +781,7 @@ class WikipediaGame(Game):
                 }
                 
                 print(f"[Wikipedia Game] Trying URL (day -{days_back}): {url}")
-                response = requests.get(url, headers=headers, timeout=10)
+                response = request_scheduler.get(url, headers=headers, timeout=10)
                 
                 if response.status_code == 200:
                     print(f"[Wikipedia Game] Successfully connected to API (day -{days_back})")